@@ -0,0 +1,41 @@
+import time
+
+from django.core.cache import cache
+
+
+# ==================== Versioned Cache Keys ====================
+
+def get_version(version_key):
+    """Return the version stored under version_key, seeding it if missing."""
+    version = cache.get(version_key)
+    if version is None:
+        # Seed from the clock so a lost version key never revives old entries
+        version = int(time.time())
+        cache.add(version_key, version, None)
+        version = cache.get(version_key, version)
+    return version
+
+
+def bump_versions(version_keys):
+    """Invalidate every entry cached under the given version keys."""
+    for version_key in version_keys:
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            # Nothing cached under this key yet
+            pass
+
+
+def get_or_compute(key, version_key, compute, timeout):
+    """
+    Return the cached value for key, storing compute() on a miss.
+    
+    Entries are tied to the current version under version_key, so
+    bump_versions([version_key]) drops all of them at once.
+    """
+    versioned_key = f'{key}:{get_version(version_key)}'
+    data = cache.get(versioned_key)
+    if data is None:
+        data = compute()
+        cache.set(versioned_key, data, timeout)
+    return data
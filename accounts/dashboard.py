@@ -1,41 +1,125 @@
-from rest_framework import serializers
+import time
+from dataclasses import asdict, dataclass, fields
+from decimal import Decimal
 
+from django.core.cache import cache
+from django.utils import timezone
 
-# ==================== Dashboard Serializers ====================
+from .cache import bump_versions, get_version
 
-class TenantDashboardSerializer(serializers.Serializer):
+
+# ==================== Dashboard Stats ====================
+
+class DashboardStats:
+    """
+    Base for the read-only dashboard payloads.
+    
+    Plain dataclasses avoid DRF serializer field iteration on every render.
+    as_dict() keeps the previous wire format by rendering Decimal fields as
+    strings with two decimal places.
+    """
+    
+    def as_dict(self):
+        data = asdict(self)
+        for field in fields(self):
+            if field.type is Decimal:
+                data[field.name] = f'{Decimal(data[field.name]):.2f}'
+        return data
+
+
+@dataclass(slots=True)
+class TenantDashboard(DashboardStats):
     """Dashboard stats for tenants."""
-    active_leases = serializers.IntegerField()
-    pending_payments = serializers.IntegerField()
-    total_paid_this_month = serializers.DecimalField(max_digits=12, decimal_places=2)
-    upcoming_due_payments = serializers.ListField()
-    open_maintenance_requests = serializers.IntegerField()
-    unread_notifications = serializers.IntegerField()
+    active_leases: int
+    pending_payments: int
+    total_paid_this_month: Decimal
+    upcoming_due_payments: list
+    open_maintenance_requests: int
+    unread_notifications: int
 
 
-class OwnerDashboardSerializer(serializers.Serializer):
+@dataclass(slots=True)
+class OwnerDashboard(DashboardStats):
     """Dashboard stats for owners."""
-    total_properties = serializers.IntegerField()
-    total_units = serializers.IntegerField()
-    occupied_units = serializers.IntegerField()
-    vacancy_rate = serializers.DecimalField(max_digits=5, decimal_places=2)
-    active_leases = serializers.IntegerField()
-    pending_payments = serializers.IntegerField()
-    revenue_this_month = serializers.DecimalField(max_digits=15, decimal_places=2)
-    pending_maintenance = serializers.IntegerField()
-    recent_payments = serializers.ListField()
-    expiring_leases = serializers.ListField()
-    unread_notifications = serializers.IntegerField()
-
-
-class AdminDashboardSerializer(serializers.Serializer):
+    total_properties: int
+    total_units: int
+    occupied_units: int
+    vacancy_rate: Decimal
+    active_leases: int
+    pending_payments: int
+    revenue_this_month: Decimal
+    pending_maintenance: int
+    recent_payments: list
+    expiring_leases: list
+    unread_notifications: int
+
+
+@dataclass(slots=True)
+class AdminDashboard(DashboardStats):
     """Dashboard stats for admins."""
-    total_users = serializers.IntegerField()
-    total_tenants = serializers.IntegerField()
-    total_owners = serializers.IntegerField()
-    total_properties = serializers.IntegerField()
-    total_units = serializers.IntegerField()
-    active_leases = serializers.IntegerField()
-    pending_verifications = serializers.IntegerField()
-    payments_this_month = serializers.DecimalField(max_digits=15, decimal_places=2)
-    pending_payment_verifications = serializers.IntegerField()
+    total_users: int
+    total_tenants: int
+    total_owners: int
+    total_properties: int
+    total_units: int
+    active_leases: int
+    pending_verifications: int
+    payments_this_month: Decimal
+    pending_payment_verifications: int
+
+
+# ==================== Dashboard Cache ====================
+
+# Stats are served from cache for DASHBOARD_CACHE_TIMEOUT seconds. Entries
+# are kept for DASHBOARD_STALE_TIMEOUT so that, while one worker rebuilds
+# an expired entry, concurrent requests get the stale copy instead of all
+# recomputing at once. Keys carry the current date, since the stats are
+# relative to today and must not outlive a day or month boundary.
+DASHBOARD_CACHE_TIMEOUT = 30
+DASHBOARD_STALE_TIMEOUT = 300
+DASHBOARD_LOCK_TIMEOUT = 10
+
+
+def _version_key(role, profile_id=None):
+    if profile_id is None:
+        return f'dash:v:{role}'
+    return f'dash:v:{role}:{profile_id}'
+
+
+def get_cached_dashboard(role, profile_id, compute):
+    """
+    Return cached dashboard data for a profile, rebuilding it with compute(today).
+    
+    today is read once here and shared by the cache key and the stats, so
+    an entry built around midnight cannot mix two dates.
+    """
+    version = get_version(_version_key(role, profile_id))
+    scope = 'all' if profile_id is None else profile_id
+    today = timezone.now().date()
+    key = f'dash:{role}:{scope}:{today.isoformat()}:{version}'
+    
+    now = time.time()
+    entry = cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    
+    lock_key = f'{key}:lock'
+    locked = cache.add(lock_key, 1, DASHBOARD_LOCK_TIMEOUT)
+    if entry is not None and not locked:
+        return entry[1]
+    
+    try:
+        data = compute(today)
+        cache.set(key, (now + DASHBOARD_CACHE_TIMEOUT, data), DASHBOARD_STALE_TIMEOUT)
+    finally:
+        if locked:
+            cache.delete(lock_key)
+    return data
+
+
+def invalidate_dashboards(tenant_ids=(), owner_ids=()):
+    """Drop cached dashboards for the given tenant/owner profiles and admins."""
+    keys = [_version_key('tenant', pk) for pk in tenant_ids if pk]
+    keys += [_version_key('owner', pk) for pk in owner_ids if pk]
+    keys.append(_version_key('admin'))
+    bump_versions(keys)
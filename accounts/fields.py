@@ -0,0 +1,42 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+
+
+# ==================== Shared Serializer Fields ====================
+
+class PrefixedCharField(serializers.CharField):
+    """Read-only char field that renders its source value with a fixed prefix."""
+
+    def __init__(self, *args, prefix='', **kwargs):
+        self._prefix = prefix
+        super().__init__(*args, **kwargs)
+
+    def to_representation(self, value):
+        return self._prefix + str(value)
+
+
+class FastChoiceField(serializers.CharField):
+    """
+    Char field validated by set membership.
+    
+    Lighter than ChoiceField for plain code lists. Pass a prebuilt
+    frozenset so the set is not rebuilt each time the field is copied.
+    """
+    default_error_messages = {
+        'invalid_choice': _('"{input}" is not a valid choice.')
+    }
+
+    def __init__(self, *args, choices, **kwargs):
+        if not isinstance(choices, frozenset):
+            choices = frozenset(
+                choice[0] if isinstance(choice, (list, tuple)) else choice
+                for choice in choices
+            )
+        self._choices = choices
+        super().__init__(*args, **kwargs)
+
+    def to_internal_value(self, data):
+        value = str(data)
+        if value not in self._choices:
+            self.fail('invalid_choice', input=data)
+        return value
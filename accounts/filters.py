@@ -0,0 +1,19 @@
+# ==================== Shared Filter Helpers ====================
+
+class CachedFormMixin:
+    """
+    Build a FilterSet's form class once per class.
+    
+    django-filter creates a new Form class with type() every time a
+    FilterSet is instantiated. Its fields only depend on the declared
+    filters, and form instances deep-copy them anyway, so the class can
+    be reused. Not for filtersets whose fields depend on the request.
+    """
+    
+    def get_form_class(self):
+        cls = type(self)
+        form_class = cls.__dict__.get('_form_class')
+        if form_class is None:
+            form_class = super().get_form_class()
+            cls._form_class = form_class
+        return form_class
@@ -0,0 +1,38 @@
+from django.contrib.auth import get_user_model
+
+
+PROFILE_RELATIONS = ('tenant_profile', 'owner_profile')
+
+
+def prefetch_profiles(user):
+    """
+    Load a user's tenant and owner profiles in one query.
+    
+    Both reverse one-to-one caches are filled, including misses, so later
+    hasattr(user, 'tenant_profile') / user.owner_profile checks in
+    permissions, views and serializers do not hit the database.
+    """
+    if not user.is_authenticated:
+        return
+    User = get_user_model()
+    relations = [User._meta.get_field(name) for name in PROFILE_RELATIONS]
+    if all(relation.is_cached(user) for relation in relations):
+        return
+    
+    loaded = User.objects.select_related(*PROFILE_RELATIONS).get(pk=user.pk)
+    for relation in relations:
+        profile = relation.get_cached_value(loaded, default=None)
+        relation.set_cached_value(user, profile)
+        if profile is not None:
+            relation.field.set_cached_value(profile, user)
+
+
+class ProfileCacheMixin:
+    """Prefetch the request user's profiles right after authentication."""
+    
+    def perform_authentication(self, request):
+        super().perform_authentication(request)
+        # Staff short-circuit every profile check and creates do not scope
+        # by profile, so neither needs the query
+        if not request.user.is_staff and self.action != 'create':
+            prefetch_profiles(request.user)
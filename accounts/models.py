@@ -45,6 +45,8 @@ class User(AbstractUser):
         choices=[('en', 'English'), ('sw', 'Swahili')],
         default='en'
     )
+    # Kept in sync by the Notification signals
+    unread_notification_count = models.PositiveIntegerField(default=0, editable=False)
     
     class Meta:
         verbose_name = _('User')
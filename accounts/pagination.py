@@ -0,0 +1,27 @@
+from rest_framework.pagination import CursorPagination
+
+
+# ==================== Pagination ====================
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination for large, growing tables such as payments and leases.
+    
+    Pages seek on the ordering column instead of using OFFSET, so deep pages
+    cost the same as the first one. The ordering comes from the view's
+    OrderingFilter, so views should only allow ordering on non-null columns:
+    a NULL position cannot be encoded in the cursor.
+    
+    Rows that tie on the first column are paged by offset, which is only
+    stable if their order is fixed, so the pk is appended to any ordering
+    that does not already end with it.
+    """
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-created_at'
+    
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if ordering[-1].lstrip('-') not in ('id', 'pk'):
+            ordering += ('-id' if ordering[0].startswith('-') else 'id',)
+        return ordering
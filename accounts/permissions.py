@@ -152,3 +152,17 @@ class CanVerifyPayment(permissions.BasePermission):
             return obj.owner == request.user.owner_profile
         
         return False
+
+
+# ==================== Shared Permission Lists ====================
+
+# Permission classes keep no per-request state, so get_permissions()
+# can return these shared tuples instead of building new instances.
+ALLOW_ANY = (permissions.AllowAny(),)
+IS_AUTHENTICATED = (permissions.IsAuthenticated(),)
+IS_ADMIN = (permissions.IsAdminUser(),)
+IS_OWNER = (IsOwner(),)
+IS_OWNER_OR_ADMIN = (IsOwnerOrAdmin(),)
+IS_TENANT_OR_ADMIN = (IsTenantOrAdmin(),)
+IS_PROPERTY_OWNER = (IsPropertyOwner(),)
+IS_LEASE_PARTICIPANT = (IsLeaseParticipant(),)
@@ -0,0 +1,33 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+
+# ==================== Renderers ====================
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson.
+    
+    Values orjson would render differently from DRF (Decimal, datetime,
+    lazy strings, ...) are handed to DRF's encoder, so the bytes match
+    JSONRenderer. Indented or non-default JSON settings, and anything
+    orjson cannot encode, go through JSONRenderer itself.
+    """
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if (
+            not api_settings.UNICODE_JSON or not api_settings.COMPACT_JSON
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=JSONEncoder().default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same escaping of the JavaScript line terminators as JSONRenderer
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
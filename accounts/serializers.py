@@ -1,14 +1,142 @@
+import copy
+
 from rest_framework import serializers
+from rest_framework.fields import SkipField, is_simple_callable
+from rest_framework.relations import PKOnlyObject, RelatedField, ManyRelatedField
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from django.db import models
+from django.utils.functional import cached_property
 from .models import Document, Tenant, Owner
 
 User = get_user_model()
 
 
+# ==================== Base Serializers ====================
+
+class FastListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer for flat read-only listings.
+    
+    Every row of a list is the same model, so each child field's source
+    path is resolved once (including which steps are callables such as
+    get_FOO_display) and reused for the remaining rows instead of going
+    through Field.get_attribute per field per row. Rows that do not fit
+    the plan fall back to the regular DRF lookup.
+    """
+    
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        
+        child_cls = type(self.child)
+        if child_cls.to_representation is not serializers.Serializer.to_representation:
+            return super().to_representation(iterable)
+        
+        plan = None
+        ret = []
+        for item in iterable:
+            if plan is None:
+                if isinstance(item, dict):
+                    return super().to_representation(iterable)
+                plan = self._build_plan(item)
+            ret.append(self._represent(item, plan))
+        return ret
+    
+    def _build_plan(self, instance):
+        plan = []
+        for field in self.child._readable_fields:
+            if isinstance(field, (RelatedField, ManyRelatedField)):
+                getter = field.get_attribute
+            elif not field.source_attrs:
+                getter = _return_instance
+            else:
+                getter = _make_attribute_getter(field, instance)
+            plan.append((field.field_name, getter, field.to_representation))
+        return plan
+    
+    def _represent(self, instance, plan):
+        ret = {}
+        for field_name, getter, to_representation in plan:
+            try:
+                attribute = getter(instance)
+            except SkipField:
+                continue
+            
+            check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            if check_for_none is None:
+                ret[field_name] = None
+            else:
+                ret[field_name] = to_representation(attribute)
+        return ret
+
+
+class ReadableFieldsMixin:
+    """
+    Cache the readable (non write_only) fields of a serializer instance.
+    
+    DRF rebuilds this as a generator on every to_representation call;
+    the bound field set does not change, so filter it once.
+    """
+    
+    @cached_property
+    def _readable_fields(self):
+        return [field for field in self.fields.values() if not field.write_only]
+
+
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields once per class.
+    
+    ModelSerializer.get_fields() introspects the model and builds every
+    field from scratch on each instantiation. The result only depends on
+    the class, so keep the first one and hand out deep copies of it.
+    Not for serializers whose fields depend on the instance or context.
+    """
+    
+    def get_fields(self):
+        cls = type(self)
+        template = cls.__dict__.get('_fields_template')
+        if template is None:
+            template = super().get_fields()
+            cls._fields_template = template
+        return copy.deepcopy(template)
+
+
+def _return_instance(instance):
+    return instance
+
+
+def _make_attribute_getter(field, sample):
+    """Build a getter for field.source_attrs using `sample` to find callables."""
+    steps = []
+    value = sample
+    try:
+        for attr in field.source_attrs:
+            value = getattr(value, attr)
+            call = is_simple_callable(value)
+            if call:
+                value = value()
+            steps.append((attr, call))
+    except Exception:
+        return field.get_attribute
+    
+    def getter(instance):
+        value = instance
+        try:
+            for attr, call in steps:
+                value = getattr(value, attr)
+                if call:
+                    value = value()
+        except Exception:
+            return field.get_attribute(instance)
+        return value
+    
+    return getter
+
+
 # ==================== User Serializers ====================
 
-class UserListSerializer(serializers.ModelSerializer):
+class UserListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Minimal user data for listings."""
     full_name = serializers.SerializerMethodField()
     
@@ -16,6 +144,8 @@ class UserListSerializer(serializers.ModelSerializer):
         model = User
         fields = ['id', 'username', 'full_name', 'email', 'phone_number', 
                   'user_type', 'is_verified']
+        read_only_fields = fields
+        list_serializer_class = FastListSerializer
     
     def get_full_name(self, obj):
         return obj.get_full_name() or obj.username
@@ -36,7 +166,7 @@ class UserSerializer(serializers.ModelSerializer):
         return obj.get_full_name() or obj.username
 
 
-class UserRegistrationSerializer(serializers.ModelSerializer):
+class UserRegistrationSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """Serializer for user registration."""
     password = serializers.CharField(write_only=True, validators=[validate_password])
     password_confirm = serializers.CharField(write_only=True)
@@ -94,7 +224,7 @@ class DocumentSerializer(serializers.ModelSerializer):
 
 # ==================== Tenant Serializers ====================
 
-class TenantListSerializer(serializers.ModelSerializer):
+class TenantListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Minimal tenant data for listings."""
     user = UserListSerializer(read_only=True)
     full_name = serializers.SerializerMethodField()
@@ -102,6 +232,8 @@ class TenantListSerializer(serializers.ModelSerializer):
     class Meta:
         model = Tenant
         fields = ['id', 'user', 'full_name', 'occupation']
+        read_only_fields = fields
+        list_serializer_class = FastListSerializer
     
     def get_full_name(self, obj):
         return obj.user.get_full_name()
@@ -141,7 +273,7 @@ class TenantCreateSerializer(serializers.ModelSerializer):
 
 # ==================== Owner Serializers ====================
 
-class OwnerListSerializer(serializers.ModelSerializer):
+class OwnerListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Minimal owner data for listings."""
     user = UserListSerializer(read_only=True)
     full_name = serializers.SerializerMethodField()
@@ -149,6 +281,8 @@ class OwnerListSerializer(serializers.ModelSerializer):
     class Meta:
         model = Owner
         fields = ['id', 'user', 'full_name', 'company_name', 'total_properties']
+        read_only_fields = fields
+        list_serializer_class = FastListSerializer
     
     def get_full_name(self, obj):
         return obj.user.get_full_name()
@@ -182,43 +316,3 @@ class OwnerCreateSerializer(serializers.ModelSerializer):
         model = Owner
         fields = ['company_name', 'tax_identification_number', 
                   'bank_name', 'account_number', 'account_name']
-
-
-# ==================== Dashboard Serializers ====================
-
-class TenantDashboardSerializer(serializers.Serializer):
-    """Dashboard stats for tenants."""
-    active_leases = serializers.IntegerField()
-    pending_payments = serializers.IntegerField()
-    total_paid_this_month = serializers.DecimalField(max_digits=12, decimal_places=2)
-    upcoming_due_payments = serializers.ListField()
-    open_maintenance_requests = serializers.IntegerField()
-    unread_notifications = serializers.IntegerField()
-
-
-class OwnerDashboardSerializer(serializers.Serializer):
-    """Dashboard stats for owners."""
-    total_properties = serializers.IntegerField()
-    total_units = serializers.IntegerField()
-    occupied_units = serializers.IntegerField()
-    vacancy_rate = serializers.DecimalField(max_digits=5, decimal_places=2)
-    active_leases = serializers.IntegerField()
-    pending_payments = serializers.IntegerField()
-    revenue_this_month = serializers.DecimalField(max_digits=15, decimal_places=2)
-    pending_maintenance = serializers.IntegerField()
-    recent_payments = serializers.ListField()
-    expiring_leases = serializers.ListField()
-    unread_notifications = serializers.IntegerField()
-
-
-class AdminDashboardSerializer(serializers.Serializer):
-    """Dashboard stats for admins."""
-    total_users = serializers.IntegerField()
-    total_tenants = serializers.IntegerField()
-    total_owners = serializers.IntegerField()
-    total_properties = serializers.IntegerField()
-    total_units = serializers.IntegerField()
-    active_leases = serializers.IntegerField()
-    pending_verifications = serializers.IntegerField()
-    payments_this_month = serializers.DecimalField(max_digits=15, decimal_places=2)
-    pending_payment_verifications = serializers.IntegerField()
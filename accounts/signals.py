@@ -1,14 +1,144 @@
-from django.db.models.signals import post_save, pre_save
+import threading
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models import Count, Exists, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
-from .models import Tenant, Owner, LeaseAgreement, RentalUnit, Property
+from .models import Tenant, Owner
+from .dashboard import invalidate_dashboards
+from leases.models import LeaseAgreement
+from maintenance.models import MaintenanceRequest
+from payments.models import Payment
+from properties.models import RentalUnit, Property
 
 User = get_user_model()
 
+# Units touched by lease changes in the current transaction, flushed on commit
+_pending = threading.local()
+
+
+class _OccupancyBatch:
+    """Units whose occupancy one transaction changed."""
+    
+    def __init__(self):
+        self.unit_ids = set()
+        # New leases that hold their unit whatever their status
+        self.holding_lease_ids = set()
+        self.flushed = False
+        
+        def flush():
+            _flush_pending_occupancy(self)
+        self.flush = flush
+
+
+def _queue_occupancy(unit_id, holding_lease_id=None):
+    """
+    Queue a unit's occupancy and property counts to be recomputed on commit.
+    
+    A batch lives only as long as its on_commit callback: when the
+    transaction, or the savepoint that registered it, rolls back, Django
+    drops the callback and the next save starts a new batch, so rolled-back
+    units never reach a later commit.
+    """
+    batch = getattr(_pending, 'batch', None)
+    registered = batch is not None and not batch.flushed and any(
+        func is batch.flush
+        for _, func, _ in transaction.get_connection().run_on_commit
+    )
+    if not registered:
+        batch = _pending.batch = _OccupancyBatch()
+    batch.unit_ids.add(unit_id)
+    if holding_lease_id is not None:
+        batch.holding_lease_ids.add(holding_lease_id)
+    if not registered:
+        # Outside a transaction this flushes straight away
+        transaction.on_commit(batch.flush)
+
+
+def mark_unit_occupied(lease):
+    """Queue a new lease's unit to be marked occupied, whatever its status, on commit."""
+    _queue_occupancy(lease.unit_id, holding_lease_id=lease.pk)
+
+
+def _flush_pending_occupancy(batch):
+    """Recompute unit occupancy and property unit counts in bulk."""
+    batch.flushed = True
+    
+    # Occupancy comes from the stored leases, so units queued by a
+    # rolled-back savepoint are recomputed to what was committed
+    holds_unit = Q(status='active')
+    if batch.holding_lease_ids:
+        holds_unit |= Q(pk__in=batch.holding_lease_ids)
+    RentalUnit.objects.filter(pk__in=batch.unit_ids).update(
+        is_occupied=Exists(
+            LeaseAgreement.objects.filter(holds_unit, unit=OuterRef('pk'))
+        )
+    )
+    
+    # Bulk updates bypass the RentalUnit signals, so recount here
+    _recount_unit_stats(Property.objects.filter(
+        pk__in=RentalUnit.objects.filter(pk__in=batch.unit_ids).values('property_id')
+    ))
+
+
+def _recount_unit_stats(properties):
+    units = RentalUnit.objects.filter(property=OuterRef('pk')).order_by().values('property')
+    
+    def count(**filters):
+        return Coalesce(Subquery(
+            units.annotate(count=Count('pk', filter=Q(**filters))).values('count')
+        ), 0)
+    
+    properties.update(
+        available_rooms=count(is_occupied=False),
+        occupied_units=count(is_occupied=True),
+        total_units=count(),
+    )
+
+
+@contextmanager
+def bulk_signal_suspend():
+    """
+    Disconnect the occupancy receivers for a bulk lease/unit operation.
+    
+    Receivers are reconnected on exit and, if the block succeeded, unit
+    occupancy, available rooms and unit counts are recomputed once for every
+    property with units. Signal connections are process-wide, so only use this in
+    management commands or admin actions, not in regular request code.
+    """
+    receivers = [
+        (post_save, update_unit_status_on_lease_change, LeaseAgreement),
+        (pre_save, store_previous_unit_occupancy, RentalUnit),
+        (post_save, update_property_available_rooms, RentalUnit),
+        (post_delete, update_property_on_unit_delete, RentalUnit),
+    ]
+    for signal, handler, sender in receivers:
+        signal.disconnect(handler, sender=sender)
+    try:
+        yield
+    finally:
+        for signal, handler, sender in receivers:
+            signal.connect(handler, sender=sender)
+    
+    RentalUnit.objects.update(
+        is_occupied=Exists(
+            LeaseAgreement.objects.filter(unit=OuterRef('pk'), status='active')
+        )
+    )
+    _recount_unit_stats(Property.objects.filter(
+        Exists(RentalUnit.objects.filter(property=OuterRef('pk')))
+    ))
+
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
     """Create tenant or owner profile based on user_type when user is created."""
+    if kwargs.get('raw', False):
+        # Fixtures carry their own profile rows
+        return
     if created:
         if instance.user_type == 'tenant':
             Tenant.objects.get_or_create(user=instance)
@@ -16,33 +146,76 @@ def create_user_profile(sender, instance, created, **kwargs):
             Owner.objects.get_or_create(user=instance)
 
 
+def bulk_create_profiles(users):
+    """
+    Create missing tenant/owner profiles for users in two INSERTs.
+    
+    User.objects.bulk_create() does not send post_save, so bulk imports
+    should call this afterwards instead of relying on create_user_profile.
+    """
+    Tenant.objects.bulk_create(
+        [Tenant(user=user) for user in users if user.user_type == 'tenant'],
+        ignore_conflicts=True
+    )
+    Owner.objects.bulk_create(
+        [Owner(user=user) for user in users if user.user_type == 'owner'],
+        ignore_conflicts=True
+    )
+
+
 @receiver(post_save, sender=LeaseAgreement)
 def update_unit_status_on_lease_change(sender, instance, **kwargs):
     """Update rental unit occupancy status when lease status changes."""
-    unit = instance.unit
-    
-    if instance.status == 'active':
-        unit.is_occupied = True
-    elif instance.status in ['terminated', 'expired']:
-        # Check if there are other active leases for this unit
-        other_active_leases = LeaseAgreement.objects.filter(
-            unit=unit, status='active'
-        ).exclude(pk=instance.pk).exists()
-        
-        if not other_active_leases:
-            unit.is_occupied = False
-    
-    unit.save(update_fields=['is_occupied'])
+    if instance.status in ['active', 'terminated', 'expired']:
+        _queue_occupancy(instance.unit_id)
+
+
+@receiver(pre_save, sender=RentalUnit)
+def store_previous_unit_occupancy(sender, instance, **kwargs):
+    """Remember the stored occupancy so post_save can apply a delta."""
+    instance._old_is_occupied = None
+    if instance.pk:
+        instance._old_is_occupied = RentalUnit.objects.filter(
+            pk=instance.pk
+        ).values_list('is_occupied', flat=True).first()
 
 
 @receiver(post_save, sender=RentalUnit)
-def update_property_available_rooms(sender, instance, **kwargs):
-    """Update property's available rooms count when unit status changes."""
-    property_obj = instance.property
-    property_obj.available_rooms = property_obj.units.filter(
-        is_occupied=False
-    ).count()
-    property_obj.save(update_fields=['available_rooms'])
+def update_property_available_rooms(sender, instance, created, **kwargs):
+    """Update property's available rooms and unit counts when a unit changes."""
+    old_is_occupied = getattr(instance, '_old_is_occupied', None)
+    if created or old_is_occupied is None:
+        # Recount so a new unit replaces, rather than adds to, the
+        # available_rooms value the property was created with
+        _recount_unit_stats(Property.objects.filter(pk=instance.property_id))
+    else:
+        _apply_occupancy_delta(
+            instance.property_id, int(instance.is_occupied) - int(old_is_occupied)
+        )
+
+
+@receiver(post_delete, sender=RentalUnit)
+def update_property_on_unit_delete(sender, instance, **kwargs):
+    """Recount a property's units after one is deleted."""
+    _recount_unit_stats(Property.objects.filter(pk=instance.property_id))
+
+
+def _apply_occupancy_delta(property_id, delta):
+    """Move one property's counts by an is_occupied flip on its units."""
+    if delta > 0:
+        changes = {
+            'available_rooms': Greatest(F('available_rooms') - delta, 0),
+            'occupied_units': F('occupied_units') + delta,
+        }
+    elif delta < 0:
+        # Clamp so a drifted counter cannot fail the unsigned column
+        changes = {
+            'available_rooms': F('available_rooms') - delta,
+            'occupied_units': Greatest(F('occupied_units') + delta, 0),
+        }
+    else:
+        return
+    Property.objects.filter(pk=property_id).update(**changes)
 
 
 @receiver(post_save, sender=Property)
@@ -50,3 +223,21 @@ def update_owner_property_count(sender, instance, created, **kwargs):
     """Update owner's total property count when property is created/deleted."""
     if created:
         instance.owner.update_property_count()
+
+
+@receiver(post_save, sender=Payment)
+@receiver(post_save, sender=MaintenanceRequest)
+def invalidate_dashboards_on_change(sender, instance, **kwargs):
+    """Drop cached dashboards of the tenant and owner a record belongs to."""
+    invalidate_dashboards(
+        tenant_ids=[instance.tenant_id], owner_ids=[instance.owner_id]
+    )
+
+
+@receiver(post_save, sender=LeaseAgreement)
+def invalidate_dashboards_on_lease_change(sender, instance, **kwargs):
+    """Drop cached dashboards of the lease's tenant and property owner."""
+    owner_id = RentalUnit.objects.filter(
+        pk=instance.unit_id
+    ).values_list('property__owner_id', flat=True).first()
+    invalidate_dashboards(tenant_ids=[instance.tenant_id], owner_ids=[owner_id])
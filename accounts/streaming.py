@@ -0,0 +1,42 @@
+from django.http import StreamingHttpResponse
+
+from .renderers import OrjsonRenderer
+
+
+# ==================== Streaming Lists ====================
+
+STREAM_CHUNK_SIZE = 2000
+
+
+def stream_list(serializer_class, queryset, context=None, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Stream a JSON array of serialized rows, chunk_size rows at a time.
+    
+    The queryset is read with .iterator() and each chunk is serialized and
+    rendered before the next one is fetched, so memory is bounded by the
+    chunk rather than the whole list. The bytes match JSONRenderer output.
+    Use it for unpaginated list actions that can grow without limit.
+    """
+    renderer = OrjsonRenderer()
+    
+    def chunks():
+        batch = []
+        for row in queryset.iterator(chunk_size=chunk_size):
+            batch.append(row)
+            if len(batch) == chunk_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def content():
+        yield b'['
+        separator = b''
+        for batch in chunks():
+            data = serializer_class(batch, many=True, context=context).data
+            # Drop the brackets of each rendered chunk array
+            yield separator + renderer.render(data)[1:-1]
+            separator = b','
+        yield b']'
+    
+    return StreamingHttpResponse(content(), content_type=renderer.media_type)
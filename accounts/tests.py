@@ -1,3 +1,133 @@
+from datetime import timedelta
+from decimal import Decimal
+
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from leases.models import LeaseAgreement
+from localities.models import LocalityLevel, Locality
+from payments.models import Payment
+from properties.models import Property, RentalUnit
+from reviews.models import Review
+from .models import User, Tenant, Owner
+
+
+def create_user(username, user_type, phone_number, **extra):
+    return User.objects.create_user(
+        username=username, password='pass12345!', user_type=user_type,
+        phone_number=phone_number, email=f'{username}@example.com', **extra
+    )
+
+
+# ==================== Profile Creation ====================
+
+class ProfileCreateTests(TestCase):
+    """POST to the profile endpoints fills in the profile made at sign-up."""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_tenant_create_updates_signup_profile(self):
+        user = create_user('tenant', 'tenant', '+255700000001')
+        self.client.force_authenticate(user)
+
+        response = self.client.post(
+            '/api/accounts/tenants/', {'occupation': 'Teacher'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Tenant.objects.filter(user=user).count(), 1)
+        self.assertEqual(Tenant.objects.get(user=user).occupation, 'Teacher')
+
+    def test_owner_create_updates_signup_profile(self):
+        user = create_user('owner', 'owner', '+255700000002')
+        self.client.force_authenticate(user)
+
+        response = self.client.post(
+            '/api/accounts/owners/', {'company_name': 'Acme'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Owner.objects.filter(user=user).count(), 1)
+        self.assertEqual(Owner.objects.get(user=user).company_name, 'Acme')
+
+
+# ==================== Keyset Pagination ====================
+
+class KeysetPaginationTests(TestCase):
+    """Every allowed ordering of a keyset-paginated list walks all rows once."""
+
+    def setUp(self):
+        owner_user = create_user('owner', 'owner', '+255700000002')
+        self.tenant_user = create_user('tenant', 'tenant', '+255700000001')
+        owner = owner_user.owner_profile
+        tenant = self.tenant_user.tenant_profile
+        level = LocalityLevel.objects.create(name='Ward', slug='ward')
+        today = timezone.now().date()
+
+        for i in range(3):
+            property_obj = Property.objects.create(
+                owner=owner, property_type='house', title=f'House {i}',
+                description='A house', monthly_rent=Decimal('100'),
+                locality=Locality.objects.create(name=f'Ward {i}', level=level)
+            )
+            unit = RentalUnit.objects.create(
+                property=property_obj, unit_type='single_room',
+                unit_number='1', unit_rent=Decimal('50')
+            )
+            # Repeated dates and amounts exercise ties in every ordering
+            lease = LeaseAgreement.objects.create(
+                tenant=tenant, unit=unit, start_date=today,
+                end_date=today + timedelta(days=30 * (i % 2 + 1)),
+                monthly_rent=Decimal('50'), security_deposit=Decimal('10')
+            )
+            Review.objects.create(
+                review_type='tenant_to_property', reviewer=self.tenant_user,
+                property=property_obj, lease=lease, rating=4, comment='Good'
+            )
+            for j in range(3):
+                Payment.objects.create(
+                    lease=lease, tenant=tenant, owner=owner,
+                    amount=Decimal('50'), payment_method='mpesa',
+                    due_date=today + timedelta(days=j), payment_period=f'{i}-{j}',
+                    payment_status='completed' if j == 0 else 'pending',
+                    payment_date=today if j == 0 else None
+                )
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.tenant_user)
+
+    def walk(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+            ids += [row['id'] for row in response.data['results']]
+            url = response.data['next']
+        return ids
+
+    def assertWalksAll(self, base_url, view_class, model):
+        # Ties must come back in pk order, in the direction of the ordering
+        for field in view_class.ordering_fields:
+            rows = sorted(model.objects.values_list(field, 'pk'))
+            expected = [pk for _, pk in rows]
+            for ordering, expected_ids in ((field, expected), (f'-{field}', expected[::-1])):
+                ids = self.walk(f'{base_url}?ordering={ordering}&page_size=2')
+                self.assertEqual(ids, expected_ids, ordering)
+
+    def test_payment_orderings(self):
+        from payments.views import PaymentViewSet
+        self.assertWalksAll('/api/payments/payments/', PaymentViewSet, Payment)
+
+    def test_lease_orderings(self):
+        from leases.views import LeaseViewSet
+        self.assertWalksAll('/api/leases/leases/', LeaseViewSet, LeaseAgreement)
+
+    def test_review_orderings(self):
+        from reviews.views import ReviewViewSet
+        self.assertWalksAll('/api/reviews/reviews/', ReviewViewSet, Review)
 
-# Create your tests here.
+    def test_nullable_ordering_is_ignored(self):
+        ids = self.walk('/api/payments/payments/?ordering=payment_date&page_size=1')
+        self.assertCountEqual(ids, Payment.objects.values_list('pk', flat=True))
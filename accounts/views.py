@@ -1,13 +1,16 @@
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.views import APIView
 from rest_framework.parsers import MultiPartParser, FormParser
 from django.contrib.auth import get_user_model
-from django.db.models import Sum
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from datetime import timedelta
+from decimal import Decimal
 
 from .models import Document, Tenant, Owner
 from .serializers import (
@@ -16,8 +19,15 @@ from .serializers import (
     TenantSerializer, TenantListSerializer, TenantCreateSerializer,
     OwnerSerializer, OwnerListSerializer, OwnerCreateSerializer
 )
-from .dashboard import TenantDashboardSerializer, OwnerDashboardSerializer, AdminDashboardSerializer
-from .permissions import IsOwner, IsTenant, IsOwnerOrAdmin, IsTenantOrAdmin
+from .dashboard import (
+    TenantDashboard, OwnerDashboard, AdminDashboard, get_cached_dashboard
+)
+from .mixins import ProfileCacheMixin
+from .permissions import (
+    IsOwner, IsTenant,
+    ALLOW_ANY, IS_ADMIN, IS_AUTHENTICATED, IS_OWNER_OR_ADMIN, IS_TENANT_OR_ADMIN
+)
+from .streaming import stream_list
 from notifications.services import NotificationService
 
 User = get_user_model()
@@ -42,10 +52,10 @@ class UserViewSet(viewsets.ModelViewSet):
     
     def get_permissions(self):
         if self.action == 'create':
-            return [AllowAny()]
+            return ALLOW_ANY
         if self.action in ['list', 'verify_user']:
-            return [IsAdminUser()]
-        return [IsAuthenticated()]
+            return IS_ADMIN
+        return IS_AUTHENTICATED
     
     def get_queryset(self):
         if self.request.user.is_staff:
@@ -79,18 +89,19 @@ class UserViewSet(viewsets.ModelViewSet):
             )
         
         request.user.set_password(serializer.validated_data['new_password'])
-        request.user.save()
+        request.user.save(update_fields=['password'])
         return Response({'message': 'Password changed successfully'})
     
     @action(detail=True, methods=['post'], permission_classes=[IsAdminUser])
     def verify_user(self, request, pk=None):
         """Admin action to verify a user."""
         user = self.get_object()
-        user.is_verified = True
-        user.save()
-        
-        # Send notification
-        NotificationService.send_account_verified(user)
+        with transaction.atomic():
+            user.is_verified = True
+            user.save(update_fields=['is_verified'])
+            
+            # Send notification
+            NotificationService.send_on_commit('account_verified', user)
         
         return Response({'message': f'User {user.username} verified successfully'})
 
@@ -115,19 +126,20 @@ class DocumentViewSet(viewsets.ModelViewSet):
     def verify(self, request, pk=None):
         """Admin action to verify a document."""
         document = self.get_object()
-        document.is_verified = True
-        document.verification_notes = request.data.get('notes', '')
-        document.save()
-        
-        # Send notification
-        NotificationService.send_document_verified(document)
+        with transaction.atomic():
+            document.is_verified = True
+            document.verification_notes = request.data.get('notes', '')
+            document.save(update_fields=['is_verified', 'verification_notes'])
+            
+            # Send notification
+            NotificationService.send_on_commit('document_verified', document)
         
         return Response({'message': 'Document verified successfully'})
 
 
 # ==================== Tenant ViewSet ====================
 
-class TenantViewSet(viewsets.ModelViewSet):
+class TenantViewSet(ProfileCacheMixin, viewsets.ModelViewSet):
     """ViewSet for managing tenant profiles."""
     
     queryset = Tenant.objects.all()
@@ -145,25 +157,30 @@ class TenantViewSet(viewsets.ModelViewSet):
     
     def get_permissions(self):
         if self.action in ['list', 'retrieve']:
-            return [IsAuthenticated()]
-        return [IsTenantOrAdmin()]
+            return IS_AUTHENTICATED
+        return IS_TENANT_OR_ADMIN
     
     def get_queryset(self):
+        queryset = Tenant.objects.select_related('user')
         if self.request.user.is_staff:
-            return Tenant.objects.all()
+            return queryset
         if hasattr(self.request.user, 'tenant_profile'):
-            return Tenant.objects.filter(user=self.request.user)
+            return queryset.filter(user=self.request.user)
         # Owners can see their tenants
         if hasattr(self.request.user, 'owner_profile'):
             from leases.models import LeaseAgreement
             owner = self.request.user.owner_profile
-            tenant_ids = LeaseAgreement.objects.filter(
-                unit__property__owner=owner
-            ).values_list('tenant_id', flat=True)
-            return Tenant.objects.filter(id__in=tenant_ids)
+            return queryset.filter(Exists(
+                LeaseAgreement.objects.filter(
+                    unit__property__owner=owner, tenant=OuterRef('pk')
+                )
+            ))
         return Tenant.objects.none()
     
     def perform_create(self, serializer):
+        # create_user_profile already made the profile when the user signed
+        # up, so fill in that row instead of inserting a second one
+        serializer.instance = Tenant.objects.filter(user=self.request.user).first()
         serializer.save(user=self.request.user)
     
     @action(detail=False, methods=['get'])
@@ -182,23 +199,21 @@ class TenantViewSet(viewsets.ModelViewSet):
         """Get all leases for a tenant."""
         from leases.serializers import LeaseListSerializer
         tenant = self.get_object()
-        leases = tenant.leases.all()
-        serializer = LeaseListSerializer(leases, many=True)
-        return Response(serializer.data)
+        leases = LeaseListSerializer.setup_queryset(tenant.leases.all())
+        return stream_list(LeaseListSerializer, leases)
     
     @action(detail=True, methods=['get'])
     def payments(self, request, pk=None):
         """Get all payments by a tenant."""
         from payments.serializers import PaymentListSerializer
         tenant = self.get_object()
-        payments = tenant.payments.all()
-        serializer = PaymentListSerializer(payments, many=True)
-        return Response(serializer.data)
+        payments = PaymentListSerializer.setup_queryset(tenant.payments.all())
+        return stream_list(PaymentListSerializer, payments)
 
 
 # ==================== Owner ViewSet ====================
 
-class OwnerViewSet(viewsets.ModelViewSet):
+class OwnerViewSet(ProfileCacheMixin, viewsets.ModelViewSet):
     """ViewSet for managing owner profiles."""
     
     queryset = Owner.objects.all()
@@ -216,8 +231,8 @@ class OwnerViewSet(viewsets.ModelViewSet):
     
     def get_permissions(self):
         if self.action in ['list', 'retrieve']:
-            return [IsAuthenticated()]
-        return [IsOwnerOrAdmin()]
+            return IS_AUTHENTICATED
+        return IS_OWNER_OR_ADMIN
     
     def get_queryset(self):
         if self.request.user.is_staff:
@@ -227,6 +242,9 @@ class OwnerViewSet(viewsets.ModelViewSet):
         return Owner.objects.none()
     
     def perform_create(self, serializer):
+        # create_user_profile already made the profile when the user signed
+        # up, so fill in that row instead of inserting a second one
+        serializer.instance = Owner.objects.filter(user=self.request.user).first()
         serializer.save(user=self.request.user)
     
     @action(detail=False, methods=['get'])
@@ -245,11 +263,10 @@ class OwnerViewSet(viewsets.ModelViewSet):
         """Get all properties owned by this owner."""
         from properties.serializers import PropertyListSerializer
         owner = self.get_object()
-        properties = owner.properties.all()
-        serializer = PropertyListSerializer(
-            properties, many=True, context={'request': request}
+        properties = PropertyListSerializer.setup_values(owner.properties.all())
+        return stream_list(
+            PropertyListSerializer, properties, context={'request': request}
         )
-        return Response(serializer.data)
     
     @action(detail=True, methods=['get'])
     def earnings(self, request, pk=None):
@@ -260,17 +277,17 @@ class OwnerViewSet(viewsets.ModelViewSet):
         start_of_month = today.replace(day=1)
         start_of_year = today.replace(month=1, day=1)
         
-        payments = owner.received_payments.filter(payment_status='completed')
-        
-        monthly_earnings = payments.filter(
-            payment_date__gte=start_of_month
-        ).aggregate(total=Sum('amount'))['total'] or 0
-        
-        yearly_earnings = payments.filter(
-            payment_date__gte=start_of_year
-        ).aggregate(total=Sum('amount'))['total'] or 0
-        
-        total_earnings = payments.aggregate(total=Sum('amount'))['total'] or 0
+        # All three totals in a single aggregate query
+        totals = owner.received_payments.filter(
+            payment_status='completed'
+        ).aggregate(
+            monthly=Sum('amount', filter=Q(payment_date__gte=start_of_month)),
+            yearly=Sum('amount', filter=Q(payment_date__gte=start_of_year)),
+            total=Sum('amount'),
+        )
+        monthly_earnings = totals['monthly'] or 0
+        yearly_earnings = totals['yearly'] or 0
+        total_earnings = totals['total'] or 0
         
         return Response({
             'monthly_earnings': monthly_earnings,
@@ -281,6 +298,15 @@ class OwnerViewSet(viewsets.ModelViewSet):
 
 # ==================== Dashboard Views ====================
 
+def _subquery_total(queryset, group_by, aggregate, default=0):
+    """Aggregate a queryset correlated on OuterRef as a scalar subquery."""
+    return Coalesce(Subquery(
+        queryset.order_by().values(group_by).annotate(
+            total=aggregate
+        ).values('total')
+    ), default)
+
+
 class TenantDashboardView(APIView):
     """Dashboard view for tenants."""
     
@@ -288,22 +314,38 @@ class TenantDashboardView(APIView):
     
     def get(self, request):
         tenant = request.user.tenant_profile
-        today = timezone.now().date()
-        start_of_month = today.replace(day=1)
-        
-        # Active leases
-        active_leases = tenant.leases.filter(status='active').count()
+        data = get_cached_dashboard(
+            'tenant', tenant.pk, lambda today: self.get_stats(request, tenant, today)
+        )
+        # The unread counter lives on the user row, so it is always fresh
+        data['unread_notifications'] = request.user.unread_notification_count
+        return Response(data)
+    
+    def get_stats(self, request, tenant, today):
+        from leases.models import LeaseAgreement
+        from maintenance.models import MaintenanceRequest
+        from payments.models import Payment
         
-        # Pending payments
-        pending_payments = tenant.payments.filter(
-            payment_status__in=['pending', 'pending_verification']
-        ).count()
+        start_of_month = today.replace(day=1)
         
-        # Total paid this month
-        total_paid = tenant.payments.filter(
-            payment_status='completed',
-            payment_date__gte=start_of_month
-        ).aggregate(total=Sum('amount'))['total'] or 0
+        # Counters from leases, payments and maintenance in one round trip
+        payments = Payment.objects.filter(tenant=OuterRef('pk'))
+        counts = Tenant.objects.filter(pk=tenant.pk).values(
+            active_leases=_subquery_total(
+                LeaseAgreement.objects.filter(tenant=OuterRef('pk'), status='active'),
+                'tenant', Count('pk')
+            ),
+            pending=_subquery_total(payments.filter(
+                payment_status__in=['pending', 'pending_verification']
+            ), 'tenant', Count('pk')),
+            paid=_subquery_total(payments.filter(
+                payment_status='completed', payment_date__gte=start_of_month
+            ), 'tenant', Sum('amount'), Decimal('0')),
+            open_maintenance=_subquery_total(MaintenanceRequest.objects.filter(
+                tenant=OuterRef('pk'),
+                status__in=['submitted', 'acknowledged', 'in_progress']
+            ), 'tenant', Count('pk'))
+        ).get()
         
         # Upcoming due payments (next 7 days)
         seven_days = today + timedelta(days=7)
@@ -311,29 +353,19 @@ class TenantDashboardView(APIView):
             payment_status='pending',
             due_date__gte=today,
             due_date__lte=seven_days
-        ).values('id', 'amount', 'due_date', 'payment_period')
-        
-        # Open maintenance requests
-        open_maintenance = tenant.maintenance_requests.filter(
-            status__in=['submitted', 'acknowledged', 'in_progress']
-        ).count()
-        
-        # Unread notifications
-        unread_notifications = request.user.notifications.filter(
-            is_read=False
-        ).count()
-        
-        data = {
-            'active_leases': active_leases,
-            'pending_payments': pending_payments,
-            'total_paid_this_month': total_paid,
-            'upcoming_due_payments': list(upcoming),
-            'open_maintenance_requests': open_maintenance,
-            'unread_notifications': unread_notifications
-        }
+        ).order_by('due_date').values(
+            'id', 'amount', 'due_date', 'payment_period', 'lease__unit__unit_number'
+        )
         
-        serializer = TenantDashboardSerializer(data)
-        return Response(serializer.data)
+        stats = TenantDashboard(
+            active_leases=counts['active_leases'],
+            pending_payments=counts['pending'],
+            total_paid_this_month=counts['paid'],
+            upcoming_due_payments=list(upcoming),
+            open_maintenance_requests=counts['open_maintenance'],
+            unread_notifications=request.user.unread_notification_count
+        )
+        return stats.as_dict()
 
 
 class OwnerDashboardView(APIView):
@@ -342,82 +374,86 @@ class OwnerDashboardView(APIView):
     permission_classes = [IsOwner]
     
     def get(self, request):
-        from properties.models import RentalUnit
+        owner = request.user.owner_profile
+        data = get_cached_dashboard(
+            'owner', owner.pk, lambda today: self.get_stats(request, owner, today)
+        )
+        # The unread counter lives on the user row, so it is always fresh
+        data['unread_notifications'] = request.user.unread_notification_count
+        return Response(data)
+    
+    def get_stats(self, request, owner, today):
         from leases.models import LeaseAgreement
+        from maintenance.models import MaintenanceRequest
+        from payments.models import MonthlyRevenue, Payment
+        from properties.models import Property
         
-        owner = request.user.owner_profile
-        today = timezone.now().date()
         start_of_month = today.replace(day=1)
         thirty_days = today + timedelta(days=30)
         
-        # Properties and units
-        properties = owner.properties.all()
-        total_properties = properties.count()
-        total_units = RentalUnit.objects.filter(property__owner=owner).count()
-        occupied_units = RentalUnit.objects.filter(
-            property__owner=owner, is_occupied=True
-        ).count()
+        # Counters from properties, leases, payments, revenue and maintenance
+        # in one round trip; unit counts are kept on each property by the
+        # RentalUnit signals
+        properties = Property.objects.filter(owner=OuterRef('pk'))
+        counts = Owner.objects.filter(pk=owner.pk).values(
+            properties_count=_subquery_total(properties, 'owner', Count('pk')),
+            total_units=_subquery_total(properties, 'owner', Sum('total_units')),
+            occupied_units=_subquery_total(properties, 'owner', Sum('occupied_units')),
+            active_leases=_subquery_total(LeaseAgreement.objects.filter(
+                unit__property__owner=OuterRef('pk'), status='active'
+            ), 'unit__property__owner', Count('pk')),
+            pending_payments=_subquery_total(Payment.objects.filter(
+                owner=OuterRef('pk'),
+                payment_status__in=['pending', 'pending_verification']
+            ), 'owner', Count('pk')),
+            revenue_this_month=Coalesce(Subquery(MonthlyRevenue.objects.filter(
+                owner=OuterRef('pk'), month=start_of_month
+            ).values('amount')[:1]), Decimal('0')),
+            pending_maintenance=_subquery_total(MaintenanceRequest.objects.filter(
+                owner=OuterRef('pk'),
+                status__in=['submitted', 'acknowledged', 'in_progress']
+            ), 'owner', Count('pk'))
+        ).get()
+        total_units = counts['total_units']
+        occupied_units = counts['occupied_units']
         
         vacancy_rate = 0
         if total_units > 0:
             vacancy_rate = ((total_units - occupied_units) / total_units) * 100
         
-        # Leases
-        active_leases = LeaseAgreement.objects.filter(
-            unit__property__owner=owner, status='active'
-        ).count()
-        
-        # Payments
-        pending_payments = owner.received_payments.filter(
-            payment_status__in=['pending', 'pending_verification']
-        ).count()
-        
-        revenue_this_month = owner.received_payments.filter(
-            payment_status='completed',
-            payment_date__gte=start_of_month
-        ).aggregate(total=Sum('amount'))['total'] or 0
-        
-        # Maintenance
-        pending_maintenance = owner.maintenance_requests.filter(
-            status__in=['submitted', 'acknowledged', 'in_progress']
-        ).count()
-        
-        # Recent payments (last 5)
+        # Recent payments (last 5); related columns are joined into the
+        # same query rather than dereferenced per row
         recent_payments = owner.received_payments.filter(
             payment_status='completed'
         ).order_by('-payment_date')[:5].values(
-            'id', 'amount', 'payment_date', 'payment_period'
+            'id', 'amount', 'payment_date', 'payment_period',
+            'lease__unit__unit_number', 'tenant__user__first_name'
         )
         
-        # Expiring leases
+        # Expiring leases, bounded like recent payments
         expiring_leases = LeaseAgreement.objects.filter(
             unit__property__owner=owner,
             status='active',
             end_date__gte=today,
             end_date__lte=thirty_days
-        ).values('id', 'tenant__user__first_name', 'end_date')
-        
-        # Unread notifications
-        unread_notifications = request.user.notifications.filter(
-            is_read=False
-        ).count()
-        
-        data = {
-            'total_properties': total_properties,
-            'total_units': total_units,
-            'occupied_units': occupied_units,
-            'vacancy_rate': round(vacancy_rate, 2),
-            'active_leases': active_leases,
-            'pending_payments': pending_payments,
-            'revenue_this_month': revenue_this_month,
-            'pending_maintenance': pending_maintenance,
-            'recent_payments': list(recent_payments),
-            'expiring_leases': list(expiring_leases),
-            'unread_notifications': unread_notifications
-        }
+        ).order_by('end_date')[:50].values(
+            'id', 'tenant__user__first_name', 'unit__unit_number', 'end_date'
+        )
         
-        serializer = OwnerDashboardSerializer(data)
-        return Response(serializer.data)
+        stats = OwnerDashboard(
+            total_properties=counts['properties_count'],
+            total_units=total_units,
+            occupied_units=occupied_units,
+            vacancy_rate=round(vacancy_rate, 2),
+            active_leases=counts['active_leases'],
+            pending_payments=counts['pending_payments'],
+            revenue_this_month=counts['revenue_this_month'],
+            pending_maintenance=counts['pending_maintenance'],
+            recent_payments=list(recent_payments),
+            expiring_leases=list(expiring_leases),
+            unread_notifications=request.user.unread_notification_count
+        )
+        return stats.as_dict()
 
 
 class AdminDashboardView(APIView):
@@ -426,49 +462,52 @@ class AdminDashboardView(APIView):
     permission_classes = [IsAdminUser]
     
     def get(self, request):
-        from properties.models import Property, RentalUnit
+        data = get_cached_dashboard('admin', None, self.get_stats)
+        return Response(data)
+    
+    def get_stats(self, today):
+        from properties.models import Property
         from leases.models import LeaseAgreement
-        from payments.models import Payment
+        from payments.models import MonthlyRevenue, Payment
         
-        today = timezone.now().date()
         start_of_month = today.replace(day=1)
         
-        # Users
-        total_users = User.objects.count()
-        total_tenants = Tenant.objects.count()
-        total_owners = Owner.objects.count()
+        # Users, profiles and pending verifications; the profile joins are
+        # one-to-one, so they do not multiply the user rows
+        user_stats = User.objects.aggregate(
+            total=Count('pk'),
+            tenants=Count('tenant_profile'),
+            owners=Count('owner_profile'),
+            unverified=Count('pk', filter=Q(is_verified=False))
+        )
         
         # Properties
-        total_properties = Property.objects.count()
-        total_units = RentalUnit.objects.count()
+        property_stats = Property.objects.aggregate(
+            total_properties=Count('pk'),
+            total_units=Coalesce(Sum('total_units'), 0)
+        )
         
         # Leases
         active_leases = LeaseAgreement.objects.filter(status='active').count()
         
-        # Verifications
-        pending_verifications = User.objects.filter(is_verified=False).count()
-        
         # Payments
-        payments_this_month = Payment.objects.filter(
-            payment_status='completed',
-            payment_date__gte=start_of_month
-        ).aggregate(total=Sum('amount'))['total'] or 0
+        payments_this_month = MonthlyRevenue.objects.filter(
+            month=start_of_month
+        ).aggregate(total=Coalesce(Sum('amount'), Decimal('0')))['total']
         
         pending_payment_verifications = Payment.objects.filter(
             payment_status='pending_verification'
         ).count()
         
-        data = {
-            'total_users': total_users,
-            'total_tenants': total_tenants,
-            'total_owners': total_owners,
-            'total_properties': total_properties,
-            'total_units': total_units,
-            'active_leases': active_leases,
-            'pending_verifications': pending_verifications,
-            'payments_this_month': payments_this_month,
-            'pending_payment_verifications': pending_payment_verifications
-        }
-        
-        serializer = AdminDashboardSerializer(data)
-        return Response(serializer.data)
+        stats = AdminDashboard(
+            total_users=user_stats['total'],
+            total_tenants=user_stats['tenants'],
+            total_owners=user_stats['owners'],
+            total_properties=property_stats['total_properties'],
+            total_units=property_stats['total_units'],
+            active_leases=active_leases,
+            pending_verifications=user_stats['unverified'],
+            payments_this_month=payments_this_month,
+            pending_payment_verifications=pending_payment_verifications
+        )
+        return stats.as_dict()
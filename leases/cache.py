@@ -0,0 +1,19 @@
+from accounts.cache import bump_versions, get_or_compute
+
+
+# ==================== Expiring Leases Cache ====================
+
+EXPIRING_CACHE_TIMEOUT = 60 * 10
+EXPIRING_VERSION_KEY = 'leases:expiring:v'
+
+
+def get_cached_expiring(user, today, compute):
+    """Return the cached expiring-soon lease list for a user."""
+    # The window moves daily, so the date is part of the key
+    key = f'leases:expiring:{user.pk}:{today.isoformat()}'
+    return get_or_compute(key, EXPIRING_VERSION_KEY, compute, EXPIRING_CACHE_TIMEOUT)
+
+
+def invalidate_expiring():
+    """Drop every cached expiring-soon lease list."""
+    bump_versions([EXPIRING_VERSION_KEY])
@@ -1,8 +1,9 @@
 import django_filters
 from .models import LeaseAgreement
+from accounts.filters import CachedFormMixin
 
 
-class LeaseFilter(django_filters.FilterSet):
+class LeaseFilter(CachedFormMixin, django_filters.FilterSet):
     """Filter for LeaseAgreement model."""
     
     # Date range filters
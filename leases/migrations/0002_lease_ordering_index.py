@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leases', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='leaseagreement',
+            index=models.Index(fields=['-start_date', '-id'], name='lease_start_id_idx'),
+        ),
+    ]
@@ -57,6 +57,10 @@ class LeaseAgreement(models.Model):
     
     class Meta:
         ordering = ['-start_date']
+        indexes = [
+            # Matches LeaseViewSet's keyset ordering
+            models.Index(fields=['-start_date', '-id'], name='lease_start_id_idx'),
+        ]
     
     def __str__(self):
         return f"Lease: {self.tenant.user.get_full_name()} - {self.unit}"
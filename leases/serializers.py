@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from .models import LeaseAgreement
-from accounts.serializers import TenantListSerializer
+from accounts.serializers import TenantListSerializer, CachedFieldsMixin, FastListSerializer, ReadableFieldsMixin
+from accounts.fields import PrefixedCharField
 from properties.serializers import RentalUnitSerializer
 from properties.models import RentalUnit
 from accounts.models import Tenant
@@ -8,27 +9,47 @@ from accounts.models import Tenant
 
 # ==================== Lease Serializers ====================
 
-class LeaseListSerializer(serializers.ModelSerializer):
+class LeaseListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Minimal lease data for listings."""
     tenant_name = serializers.SerializerMethodField()
-    unit_info = serializers.SerializerMethodField()
+    unit_info = PrefixedCharField(
+        source='unit.unit_number', prefix='Unit ', read_only=True
+    )
     property_title = serializers.CharField(source='unit.property.title', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
+    is_active = serializers.SerializerMethodField()
     
     class Meta:
         model = LeaseAgreement
         fields = ['id', 'tenant_name', 'property_title', 'unit_info',
                   'start_date', 'end_date', 'monthly_rent', 'status',
                   'status_display', 'is_active']
+        read_only_fields = fields
+        list_serializer_class = FastListSerializer
+    
+    @staticmethod
+    def setup_queryset(queryset):
+        """Join and load only the columns this serializer reads."""
+        return queryset.select_related(None).select_related(
+            'tenant__user', 'unit__property'
+        ).only(
+            'id', 'start_date', 'end_date', 'monthly_rent', 'status',
+            'tenant__user__first_name', 'tenant__user__last_name',
+            'unit__unit_number', 'unit__property__title'
+        )
     
     def get_tenant_name(self, obj):
         return obj.tenant.user.get_full_name()
     
-    def get_unit_info(self, obj):
-        return f"Unit {obj.unit.unit_number}"
+    def get_is_active(self, obj):
+        # Prefer the is_active_db annotation added by LeaseViewSet
+        is_active = getattr(obj, 'is_active_db', None)
+        if is_active is None:
+            return obj.is_active
+        return is_active
 
 
-class LeaseSerializer(serializers.ModelSerializer):
+class LeaseSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """Full lease details."""
     tenant = TenantListSerializer(read_only=True)
     tenant_id = serializers.PrimaryKeyRelatedField(
@@ -62,7 +83,7 @@ class LeaseSerializer(serializers.ModelSerializer):
         return {
             'id': obj.unit.property.id,
             'title': obj.unit.property.title,
-            'address': str(obj.unit.property.locality)
+            'address': obj.unit.property.locality.name
         }
     
     def get_owner_info(self, obj):
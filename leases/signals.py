@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_expiring
+from .models import LeaseAgreement
+
+
+@receiver(post_save, sender=LeaseAgreement)
+@receiver(post_delete, sender=LeaseAgreement)
+def invalidate_expiring_leases(sender, **kwargs):
+    """Drop cached expiring-soon lists when a lease changes."""
+    invalidate_expiring()
@@ -1,3 +1,108 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import transaction
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from localities.models import LocalityLevel, Locality
+from properties.models import Property, RentalUnit
+from .models import LeaseAgreement
+
+
+# ==================== Unit Occupancy ====================
+
+class LeaseOccupancyTests(TestCase):
+    """Creating and terminating leases keeps unit and property counts right."""
+
+    def setUp(self):
+        owner_user = User.objects.create_user(
+            username='owner', password='pass12345!', user_type='owner',
+            phone_number='+255700000002'
+        )
+        self.tenant_user = User.objects.create_user(
+            username='tenant', password='pass12345!', user_type='tenant',
+            phone_number='+255700000001'
+        )
+        level = LocalityLevel.objects.create(name='Ward', slug='ward')
+        self.property = Property.objects.create(
+            owner=owner_user.owner_profile, property_type='house', title='House',
+            description='A house', monthly_rent=Decimal('100'),
+            locality=Locality.objects.create(name='Ward 1', level=level)
+        )
+        self.units = [
+            RentalUnit.objects.create(
+                property=self.property, unit_type='single_room',
+                unit_number=number, unit_rent=Decimal('50')
+            )
+            for number in ('1', '2')
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.tenant_user)
+
+    def create_lease(self):
+        today = timezone.now().date()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/leases/leases/', {
+                'tenant_id': self.tenant_user.tenant_profile.pk,
+                'unit_id': self.units[0].pk,
+                'start_date': today, 'end_date': today + timedelta(days=30),
+                'monthly_rent': '50.00', 'security_deposit': '10.00',
+            }, format='json')
+        self.assertEqual(response.status_code, 201)
+        return response
+
+    def assertCounts(self, available, occupied):
+        self.property.refresh_from_db()
+        self.assertEqual(
+            (self.property.available_rooms, self.property.occupied_units),
+            (available, occupied)
+        )
+
+    def test_create_occupies_unit(self):
+        response = self.create_lease()
+
+        self.assertTrue(response.data['unit']['is_occupied'])
+        self.units[0].refresh_from_db()
+        self.assertTrue(self.units[0].is_occupied)
+        self.assertCounts(available=1, occupied=1)
+
+    def test_terminate_frees_unit(self):
+        lease_id = self.create_lease().data['id']
+        LeaseAgreement.objects.filter(pk=lease_id).update(status='active')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f'/api/leases/leases/{lease_id}/terminate/')
+
+        self.assertEqual(response.status_code, 200)
+        self.units[0].refresh_from_db()
+        self.assertFalse(self.units[0].is_occupied)
+        self.assertCounts(available=2, occupied=0)
+
+    def test_rolled_back_lease_does_not_occupy_unit(self):
+        today = timezone.now().date()
+        tenant = self.tenant_user.tenant_profile
+
+        def create_active_lease(unit):
+            return LeaseAgreement.objects.create(
+                tenant=tenant, unit=unit, start_date=today,
+                end_date=today + timedelta(days=30), status='active',
+                monthly_rent=Decimal('50'), security_deposit=Decimal('10')
+            )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    create_active_lease(self.units[0])
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            create_active_lease(self.units[1])
 
-# Create your tests here.
+        self.units[0].refresh_from_db()
+        self.units[1].refresh_from_db()
+        self.assertFalse(self.units[0].is_occupied)
+        self.assertTrue(self.units[1].is_occupied)
+        self.assertCounts(available=1, occupied=1)
@@ -1,8 +1,10 @@
+from django.conf import settings
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import DefaultRouter, SimpleRouter
 from . import views
 
-router = DefaultRouter()
+# The browsable API root index is only exposed in development
+router = DefaultRouter() if settings.DEBUG else SimpleRouter()
 router.register(r'leases', views.LeaseViewSet, basename='lease')
 
 urlpatterns = [
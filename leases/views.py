@@ -2,17 +2,24 @@ from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from django.db import transaction
+from django.db.models import BooleanField, Case, Q, Value, When
 from django.utils import timezone
 from datetime import timedelta
 
+from .cache import get_cached_expiring
 from .models import LeaseAgreement
 from .serializers import LeaseSerializer, LeaseListSerializer, LeaseRenewalSerializer
 from .filters import LeaseFilter
-from accounts.permissions import IsLeaseParticipant
+from accounts.mixins import ProfileCacheMixin
+from accounts.pagination import KeysetPagination
+from accounts.permissions import IS_LEASE_PARTICIPANT
+from accounts.signals import mark_unit_occupied
+from accounts.streaming import stream_list
 from notifications.services import NotificationService
 
 
-class LeaseViewSet(viewsets.ModelViewSet):
+class LeaseViewSet(ProfileCacheMixin, viewsets.ModelViewSet):
     """ViewSet for managing lease agreements."""
     
     queryset = LeaseAgreement.objects.all()
@@ -21,7 +28,8 @@ class LeaseViewSet(viewsets.ModelViewSet):
     search_fields = ['tenant__user__first_name', 'tenant__user__last_name',
                      'unit__property__title']
     ordering_fields = ['start_date', 'end_date', 'monthly_rent', 'created_at']
-    ordering = ['-start_date']
+    ordering = ['-start_date', '-id']
+    pagination_class = KeysetPagination
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -29,43 +37,62 @@ class LeaseViewSet(viewsets.ModelViewSet):
         return LeaseSerializer
     
     def get_permissions(self):
-        return [IsLeaseParticipant()]
+        return IS_LEASE_PARTICIPANT
+    
+    # Actions rendering LeaseListSerializer get its narrowed queryset
+    list_actions = ('list', 'expiring_soon')
     
     def get_queryset(self):
+        queryset = self._get_base_queryset()
+        if self.action in self.list_actions:
+            queryset = LeaseListSerializer.setup_queryset(queryset)
+        return self._annotate_is_active(queryset)
+    
+    def _get_base_queryset(self):
         user = self.request.user
+        queryset = LeaseAgreement.objects.select_related(
+            'tenant__user', 'unit__property__owner__user', 'unit__property__locality'
+        )
         if user.is_staff:
-            return LeaseAgreement.objects.all()
-        
-        queryset = LeaseAgreement.objects.none()
+            return queryset
         
+        # A single OR filter; both paths follow forward FKs, so no DISTINCT
+        visible = Q()
         if hasattr(user, 'tenant_profile'):
-            queryset = queryset | LeaseAgreement.objects.filter(
-                tenant=user.tenant_profile
-            )
-        
+            visible |= Q(tenant=user.tenant_profile)
         if hasattr(user, 'owner_profile'):
-            queryset = queryset | LeaseAgreement.objects.filter(
-                unit__property__owner=user.owner_profile
+            visible |= Q(unit__property__owner=user.owner_profile)
+        if not visible:
+            return queryset.none()
+        return queryset.filter(visible)
+    
+    def _annotate_is_active(self, queryset):
+        # Mirrors LeaseAgreement.is_active so list rows read a DB column
+        today = timezone.now().date()
+        return queryset.annotate(
+            is_active_db=Case(
+                When(
+                    status='active',
+                    start_date__lte=today,
+                    end_date__gte=today,
+                    then=Value(True)
+                ),
+                default=Value(False),
+                output_field=BooleanField()
             )
-        
-        return queryset.distinct()
+        )
     
     def perform_create(self, serializer):
-        lease = serializer.save()
-        
-        # Update unit status
-        lease.unit.is_occupied = True
-        lease.unit.save()
-        
-        # Update property available rooms
-        property_obj = lease.unit.property
-        property_obj.available_rooms = property_obj.units.filter(
-            is_occupied=False
-        ).count()
-        property_obj.save()
-        
-        # Send notification
-        NotificationService.send_lease_created(lease)
+        with transaction.atomic():
+            lease = serializer.save()
+            
+            # A new lease holds its unit whatever its status; the occupancy
+            # flush writes the unit and recounts its property on commit
+            mark_unit_occupied(lease)
+            lease.unit.is_occupied = True
+            
+            # Send notification once the lease is committed
+            NotificationService.send_on_commit('lease_created', lease)
     
     @action(detail=True, methods=['post'])
     def activate(self, request, pk=None):
@@ -79,7 +106,7 @@ class LeaseViewSet(viewsets.ModelViewSet):
         
         lease.status = 'active'
         lease.signed_date = timezone.now().date()
-        lease.save()
+        lease.save(update_fields=['status', 'signed_date', 'updated_at'])
         
         serializer = LeaseSerializer(lease)
         return Response(serializer.data)
@@ -89,11 +116,9 @@ class LeaseViewSet(viewsets.ModelViewSet):
         """Terminate a lease early."""
         lease = self.get_object()
         lease.status = 'terminated'
-        lease.save()
-        
-        # Free up the unit
-        lease.unit.is_occupied = False
-        lease.unit.save()
+        # The lease signal frees the unit, unless another active lease
+        # holds it, and recounts its property
+        lease.save(update_fields=['status', 'updated_at'])
         
         return Response({'message': 'Lease terminated successfully'})
     
@@ -104,30 +129,44 @@ class LeaseViewSet(viewsets.ModelViewSet):
         serializer = LeaseRenewalSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        # Mark old lease as renewed
-        lease.status = 'renewed'
-        lease.save()
-        
-        # Create new lease
-        new_lease = LeaseAgreement.objects.create(
-            tenant=lease.tenant,
-            unit=lease.unit,
-            start_date=serializer.validated_data['new_start_date'],
-            end_date=serializer.validated_data['new_end_date'],
-            monthly_rent=serializer.validated_data.get(
-                'new_monthly_rent', lease.monthly_rent
-            ),
-            security_deposit=lease.security_deposit,
-            deposit_paid=lease.deposit_paid,
-            payment_frequency=lease.payment_frequency,
-            payment_due_day=lease.payment_due_day,
-            terms_conditions=lease.terms_conditions,
-            status='active',
-            signed_date=timezone.now().date()
-        )
-        
-        # Send notification
-        NotificationService.send_lease_renewed(new_lease)
+        with transaction.atomic():
+            # Lock the lease so concurrent requests cannot both renew it
+            current_status = LeaseAgreement.objects.select_for_update().filter(
+                pk=lease.pk
+            ).values_list('status', flat=True).get()
+            if current_status == 'renewed':
+                return Response(
+                    {'error': 'Lease has already been renewed'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            # Mark old lease as renewed; the new lease's signals cover the
+            # same tenant and unit, so the old row skips save()
+            now = timezone.now()
+            LeaseAgreement.objects.filter(pk=lease.pk).update(
+                status='renewed', updated_at=now
+            )
+            
+            # Create new lease
+            new_lease = LeaseAgreement.objects.create(
+                tenant=lease.tenant,
+                unit=lease.unit,
+                start_date=serializer.validated_data['new_start_date'],
+                end_date=serializer.validated_data['new_end_date'],
+                monthly_rent=serializer.validated_data.get(
+                    'new_monthly_rent', lease.monthly_rent
+                ),
+                security_deposit=lease.security_deposit,
+                deposit_paid=lease.deposit_paid,
+                payment_frequency=lease.payment_frequency,
+                payment_due_day=lease.payment_due_day,
+                terms_conditions=lease.terms_conditions,
+                status='active',
+                signed_date=now.date()
+            )
+            
+            # Send notification
+            NotificationService.send_on_commit('lease_renewed', new_lease)
         
         return Response(
             LeaseSerializer(new_lease).data, 
@@ -140,19 +179,21 @@ class LeaseViewSet(viewsets.ModelViewSet):
         today = timezone.now().date()
         thirty_days = today + timedelta(days=30)
         
-        leases = self.get_queryset().filter(
-            status='active',
-            end_date__gte=today,
-            end_date__lte=thirty_days
-        )
-        serializer = LeaseListSerializer(leases, many=True)
-        return Response(serializer.data)
+        def compute():
+            leases = self.get_queryset().filter(
+                status='active',
+                end_date__gte=today,
+                end_date__lte=thirty_days
+            )
+            serializer = LeaseListSerializer(leases, many=True)
+            return serializer.data
+        
+        return Response(get_cached_expiring(request.user, today, compute))
     
     @action(detail=True, methods=['get'])
     def payments(self, request, pk=None):
         """Get all payments for a lease."""
         from payments.serializers import PaymentListSerializer
         lease = self.get_object()
-        payments = lease.payments.all()
-        serializer = PaymentListSerializer(payments, many=True)
-        return Response(serializer.data)
+        payments = PaymentListSerializer.setup_queryset(lease.payments.all())
+        return stream_list(PaymentListSerializer, payments)
@@ -1,8 +1,9 @@
 import django_filters
 from .models import MaintenanceRequest
+from accounts.filters import CachedFormMixin
 
 
-class MaintenanceRequestFilter(django_filters.FilterSet):
+class MaintenanceRequestFilter(CachedFormMixin, django_filters.FilterSet):
     """Filter for MaintenanceRequest model."""
     
     # Date range filters
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maintenance', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='maintenancerequest',
+            index=models.Index(condition=models.Q(('priority__in', ['urgent', 'high']), ('status__in', ['submitted', 'acknowledged', 'in_progress'])), fields=['request_date'], name='maint_open_urgent_idx'),
+        ),
+    ]
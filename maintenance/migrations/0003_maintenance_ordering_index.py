@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maintenance', '0002_maintenance_urgent_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='maintenancerequest',
+            index=models.Index(fields=['-request_date'], name='maint_request_date_idx'),
+        ),
+    ]
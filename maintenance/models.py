@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 from django.core.validators import MinValueValidator
 from decimal import Decimal
 from accounts.models import Tenant, Owner
@@ -64,6 +65,17 @@ class MaintenanceRequest(models.Model):
     
     class Meta:
         ordering = ['-request_date']
+        indexes = [
+            models.Index(fields=['-request_date'], name='maint_request_date_idx'),
+            # Partial index for the open urgent/high priority queue
+            models.Index(
+                fields=['request_date'], name='maint_open_urgent_idx',
+                condition=Q(
+                    priority__in=['urgent', 'high'],
+                    status__in=['submitted', 'acknowledged', 'in_progress']
+                )
+            ),
+        ]
     
     def __str__(self):
         return f"{self.get_issue_type_display()} - {self.unit}"
@@ -1,10 +1,14 @@
 from rest_framework import serializers
 from .models import MaintenanceRequest, MaintenanceImage
-from accounts.serializers import TenantListSerializer, OwnerListSerializer
+from accounts.serializers import TenantListSerializer, OwnerListSerializer, CachedFieldsMixin, FastListSerializer
+from accounts.fields import PrefixedCharField, FastChoiceField
 from properties.serializers import RentalUnitListSerializer
 from properties.models import RentalUnit
 
 
+_STATUS_SET = frozenset(code for code, _ in MaintenanceRequest.STATUS_CHOICES)
+
+
 # ==================== Maintenance Request Serializers ====================
 
 class MaintenanceImageSerializer(serializers.ModelSerializer):
@@ -16,10 +20,12 @@ class MaintenanceImageSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'uploaded_at']
 
 
-class MaintenanceRequestListSerializer(serializers.ModelSerializer):
+class MaintenanceRequestListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Minimal maintenance request data."""
     tenant_name = serializers.SerializerMethodField()
-    unit_info = serializers.SerializerMethodField()
+    unit_info = PrefixedCharField(
+        source='unit.unit_number', prefix='Unit ', read_only=True
+    )
     property_title = serializers.CharField(
         source='unit.property.title', read_only=True
     )
@@ -39,12 +45,22 @@ class MaintenanceRequestListSerializer(serializers.ModelSerializer):
                   'issue_type', 'issue_type_display', 'priority',
                   'priority_display', 'status', 'status_display',
                   'request_date']
+        read_only_fields = fields
+        list_serializer_class = FastListSerializer
+    
+    @staticmethod
+    def setup_queryset(queryset):
+        """Join and load only the columns this serializer reads."""
+        return queryset.select_related(None).select_related(
+            'tenant__user', 'unit__property'
+        ).only(
+            'id', 'issue_type', 'priority', 'status', 'request_date',
+            'tenant__user__first_name', 'tenant__user__last_name',
+            'unit__unit_number', 'unit__property__title'
+        )
     
     def get_tenant_name(self, obj):
         return obj.tenant.user.get_full_name()
-    
-    def get_unit_info(self, obj):
-        return f"Unit {obj.unit.unit_number}"
 
 
 class MaintenanceRequestSerializer(serializers.ModelSerializer):
@@ -99,9 +115,7 @@ class MaintenanceRequestCreateSerializer(serializers.ModelSerializer):
 
 class MaintenanceStatusUpdateSerializer(serializers.Serializer):
     """Serializer for updating maintenance status."""
-    status = serializers.ChoiceField(
-        choices=MaintenanceRequest.STATUS_CHOICES
-    )
+    status = FastChoiceField(choices=_STATUS_SET)
     resolution_notes = serializers.CharField(required=False, allow_blank=True)
     cost = serializers.DecimalField(
         max_digits=12, decimal_places=2, required=False
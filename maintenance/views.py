@@ -1,9 +1,10 @@
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
 from django_filters.rest_framework import DjangoFilterBackend
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 
 from .models import MaintenanceRequest, MaintenanceImage
@@ -13,10 +14,12 @@ from .serializers import (
     MaintenanceImageSerializer
 )
 from .filters import MaintenanceRequestFilter
+from accounts.mixins import ProfileCacheMixin
+from accounts.permissions import IS_AUTHENTICATED
 from notifications.services import NotificationService
 
 
-class MaintenanceRequestViewSet(viewsets.ModelViewSet):
+class MaintenanceRequestViewSet(ProfileCacheMixin, viewsets.ModelViewSet):
     """ViewSet for managing maintenance requests."""
     
     queryset = MaintenanceRequest.objects.all()
@@ -34,32 +37,38 @@ class MaintenanceRequestViewSet(viewsets.ModelViewSet):
         return MaintenanceRequestSerializer
     
     def get_permissions(self):
-        return [IsAuthenticated()]
+        return IS_AUTHENTICATED
+    
+    # Actions rendering MaintenanceRequestListSerializer get its narrowed queryset
+    list_actions = ('list', 'urgent')
     
     def get_queryset(self):
         user = self.request.user
+        queryset = MaintenanceRequest.objects.select_related(
+            'tenant__user', 'owner__user', 'unit__property'
+        )
+        if self.action in self.list_actions:
+            queryset = MaintenanceRequestListSerializer.setup_queryset(queryset)
+        else:
+            queryset = queryset.prefetch_related('images')
         if user.is_staff:
-            return MaintenanceRequest.objects.all()
-        
-        queryset = MaintenanceRequest.objects.none()
+            return queryset
         
+        visible = Q()
         if hasattr(user, 'tenant_profile'):
-            queryset = queryset | MaintenanceRequest.objects.filter(
-                tenant=user.tenant_profile
-            )
-        
+            visible |= Q(tenant=user.tenant_profile)
         if hasattr(user, 'owner_profile'):
-            queryset = queryset | MaintenanceRequest.objects.filter(
-                owner=user.owner_profile
-            )
-        
-        return queryset.distinct()
+            visible |= Q(owner=user.owner_profile)
+        if not visible:
+            return queryset.none()
+        return queryset.filter(visible)
     
     def perform_create(self, serializer):
-        request = serializer.save()
-        
-        # Send notification to owner
-        NotificationService.send_maintenance_submitted(request)
+        with transaction.atomic():
+            request = serializer.save()
+            
+            # Send notification to owner
+            NotificationService.send_on_commit('maintenance_submitted', request)
     
     @action(detail=True, methods=['post'])
     def update_status(self, request, pk=None):
@@ -72,28 +81,33 @@ class MaintenanceRequestViewSet(viewsets.ModelViewSet):
         new_status = serializer.validated_data['status']
         
         maintenance_request.status = new_status
+        # Only write the columns this status change touches
+        update_fields = ['status']
         
         if new_status == 'acknowledged' and old_status == 'submitted':
             maintenance_request.acknowledged_date = timezone.now()
+            update_fields.append('acknowledged_date')
         
         if new_status == 'completed':
             maintenance_request.resolved_date = timezone.now()
-            if 'cost' in serializer.validated_data:
-                maintenance_request.cost = serializer.validated_data['cost']
-            if 'cost_responsibility' in serializer.validated_data:
-                maintenance_request.cost_responsibility = serializer.validated_data['cost_responsibility']
+            update_fields.append('resolved_date')
+            for field in ('cost', 'cost_responsibility'):
+                if field in serializer.validated_data:
+                    setattr(maintenance_request, field, serializer.validated_data[field])
+                    update_fields.append(field)
         
-        if 'resolution_notes' in serializer.validated_data:
-            maintenance_request.resolution_notes = serializer.validated_data['resolution_notes']
-        if 'technician_name' in serializer.validated_data:
-            maintenance_request.technician_name = serializer.validated_data['technician_name']
-        if 'technician_contact' in serializer.validated_data:
-            maintenance_request.technician_contact = serializer.validated_data['technician_contact']
+        for field in ('resolution_notes', 'technician_name', 'technician_contact'):
+            if field in serializer.validated_data:
+                setattr(maintenance_request, field, serializer.validated_data[field])
+                update_fields.append(field)
         
-        maintenance_request.save()
-        
-        # Send notification based on status change
-        NotificationService.send_maintenance_update(maintenance_request, new_status)
+        with transaction.atomic():
+            maintenance_request.save(update_fields=update_fields)
+            
+            # Send notification based on status change
+            NotificationService.send_on_commit(
+                'maintenance_update', maintenance_request, new_status
+            )
         
         return Response(MaintenanceRequestSerializer(maintenance_request).data)
     
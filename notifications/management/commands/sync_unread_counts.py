@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from notifications.models import Notification
+
+
+class Command(BaseCommand):
+    help = 'Recompute unread notification counters; safe to run from cron.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user', type=int, action='append', dest='users',
+            help='Only sync this user id (repeatable)'
+        )
+    
+    def handle(self, *args, users=None, **options):
+        updated = Notification.sync_unread_counts(users=users)
+        self.stdout.write(self.style.SUCCESS(
+            f'Synced unread notification counts for {updated} users.'
+        ))
@@ -50,3 +50,17 @@ class Notification(models.Model):
         if language == 'sw' and self.message_swahili:
             return self.message_swahili
         return self.message
+    
+    @classmethod
+    def sync_unread_counts(cls, users=None):
+        """Recompute User.unread_notification_count from stored notifications."""
+        from django.db.models import Count, OuterRef, Subquery
+        from django.db.models.functions import Coalesce
+        
+        unread = cls.objects.filter(
+            user=OuterRef('pk'), is_read=False
+        ).order_by().values('user').annotate(count=Count('pk')).values('count')
+        targets = User.objects.all()
+        if users is not None:
+            targets = targets.filter(pk__in=users)
+        return targets.update(unread_notification_count=Coalesce(Subquery(unread), 0))
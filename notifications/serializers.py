@@ -17,7 +17,18 @@ class NotificationSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
     
     def get_message_localized(self, obj):
-        request = self.context.get('request')
-        if request and hasattr(request, 'user'):
-            return obj.get_message(request.user.preferred_language)
+        language = self._get_language()
+        if language:
+            return obj.get_message(language)
         return obj.message
+    
+    def _get_language(self):
+        # Resolved once and shared through the context, so a list of
+        # notifications does not repeat the request/user lookup per row.
+        if '_lang' not in self.context:
+            request = self.context.get('request')
+            language = None
+            if request and hasattr(request, 'user'):
+                language = request.user.preferred_language
+            self.context['_lang'] = language
+        return self.context['_lang']
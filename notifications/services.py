@@ -1,9 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from django.core.mail import send_mail
+from django.db import connection, transaction
 from django.template.loader import render_to_string
 from django.conf import settings
 from django.utils import timezone
 from .models import Notification
 
+# Emails go out on a small worker pool so SMTP round trips do not hold up
+# the request that triggered them. Pending sends finish before the
+# process exits.
+_email_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix='notification-email'
+)
+
 
 class NotificationService:
     """Service for handling notifications and emails."""
@@ -27,10 +37,28 @@ class NotificationService:
         )
         
         if send_email and user.email:
-            cls.send_email_notification(notification)
+            # Submit after commit so the worker can see the new row; the
+            # worker loads it by pk rather than using this instance, which
+            # may be stale by the time the email goes out
+            notification_id = notification.pk
+            transaction.on_commit(lambda: _email_executor.submit(
+                cls._send_email_in_worker, notification_id
+            ))
         
         return notification
     
+    @classmethod
+    def _send_email_in_worker(cls, notification_id):
+        try:
+            notification = Notification.objects.select_related('user').filter(
+                pk=notification_id
+            ).first()
+            if notification is not None:
+                cls.send_email_notification(notification)
+        finally:
+            # Worker threads get their own connection; don't leave it open
+            connection.close()
+    
     @classmethod
     def send_email_notification(cls, notification):
         """Send email for a notification."""
@@ -46,14 +74,29 @@ class NotificationService:
                 fail_silently=True
             )
             
+            # Write only the email flags, without the save signals
             notification.email_sent = True
             notification.email_sent_at = timezone.now()
-            notification.save(update_fields=['email_sent', 'email_sent_at'])
+            Notification.objects.filter(pk=notification.pk).update(
+                email_sent=True, email_sent_at=notification.email_sent_at
+            )
             
         except Exception as e:
             # Log the error but don't fail
             print(f"Email sending failed: {e}")
     
+    @classmethod
+    def send_on_commit(cls, kind, *args):
+        """
+        Call send_<kind>(*args) once the current transaction commits.
+        
+        Keeps notification writes and email I/O out of the caller's
+        transaction and skips them if it rolls back. Views go through
+        this, so it is the one place to hand sending to a task queue.
+        """
+        sender = getattr(cls, f'send_{kind}')
+        transaction.on_commit(lambda: sender(*args))
+    
     # ==================== Rent Reminder Notifications ====================
     
     @classmethod
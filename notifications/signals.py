@@ -0,0 +1,56 @@
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from accounts.models import User
+from .models import Notification
+
+
+def adjust_unread_count(user_id, delta):
+    """Apply a change to a user's unread notification counter."""
+    if delta > 0:
+        value = F('unread_notification_count') + delta
+    else:
+        # Clamp so a drifted counter cannot fail the unsigned column
+        value = Greatest(F('unread_notification_count') + delta, 0)
+    User.objects.filter(pk=user_id).update(unread_notification_count=value)
+
+
+def _writes_is_read(update_fields):
+    return update_fields is None or 'is_read' in update_fields
+
+
+@receiver(pre_save, sender=Notification)
+@receiver(pre_delete, sender=Notification)
+def store_previous_read_state(sender, instance, **kwargs):
+    """Remember the stored read flag so post_save/post_delete can adjust the counter."""
+    instance._old_is_read = None
+    # Only read the stored row when this save writes is_read
+    if instance.pk and _writes_is_read(kwargs.get('update_fields')):
+        instance._old_is_read = Notification.objects.filter(
+            pk=instance.pk
+        ).values_list('is_read', flat=True).first()
+
+
+@receiver(post_save, sender=Notification)
+def update_unread_count(sender, instance, created, **kwargs):
+    """Count new unread notifications and read-state changes."""
+    if not _writes_is_read(kwargs.get('update_fields')):
+        # The stored flag is untouched, whatever the instance holds
+        return
+    old_is_read = getattr(instance, '_old_is_read', None)
+    if created or old_is_read is None:
+        delta = 0 if instance.is_read else 1
+    else:
+        delta = int(old_is_read) - int(instance.is_read)
+    if delta:
+        adjust_unread_count(instance.user_id, delta)
+
+
+@receiver(post_delete, sender=Notification)
+def remove_unread_count(sender, instance, **kwargs):
+    """Drop a deleted unread notification from the counter."""
+    # Use the stored flag rather than the instance, which may be stale
+    if getattr(instance, '_old_is_read', None) is False:
+        adjust_unread_count(instance.user_id, -1)
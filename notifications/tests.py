@@ -1,3 +1,144 @@
+from unittest import mock
+
+from django.core import mail
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from .models import Notification
+from .services import NotificationService
+
+
+# ==================== Unread Counter ====================
+
+class UnreadCountTests(TestCase):
+    """User.unread_notification_count follows notifications as they are read and deleted."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='tenant', password='pass12345!', user_type='tenant',
+            phone_number='+255700000001', email='tenant@example.com'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def notify(self, **extra):
+        return Notification.objects.create(
+            user=self.user, notification_type='general', title='Hello',
+            message='Hello', **extra
+        )
+
+    def assertCountMatchesNotifications(self):
+        self.user.refresh_from_db()
+        self.assertEqual(
+            self.user.unread_notification_count,
+            Notification.objects.filter(user=self.user, is_read=False).count()
+        )
+        response = self.client.get('/api/notifications/notifications/unread_count/')
+        self.assertEqual(response.data['unread_count'], self.user.unread_notification_count)
+
+    def test_create_read_and_delete(self):
+        notifications = [self.notify() for _ in range(4)]
+        self.notify(is_read=True)
+        self.assertCountMatchesNotifications()
+
+        # Reading the same notification twice only counts once
+        for _ in range(2):
+            response = self.client.patch(
+                f'/api/notifications/notifications/{notifications[0].pk}/',
+                {'is_read': True}, format='json'
+            )
+            self.assertEqual(response.status_code, 200)
+        self.assertCountMatchesNotifications()
+
+        # The in-memory copy is stale: it was read through the API above
+        notifications[0].delete()
+        response = self.client.delete(f'/api/notifications/notifications/{notifications[1].pk}/')
+        self.assertEqual(response.status_code, 204)
+        self.assertCountMatchesNotifications()
+
+        notifications[2].is_read = True
+        notifications[2].save()
+        self.notify()
+        self.assertCountMatchesNotifications()
+        self.assertEqual(self.user.unread_notification_count, 2)
+
+    def test_save_without_is_read_leaves_count(self):
+        stale = self.notify()
+        response = self.client.patch(
+            f'/api/notifications/notifications/{stale.pk}/', {'is_read': True}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+
+        stale.email_sent = True
+        stale.save(update_fields=['email_sent', 'email_sent_at'])
+        self.assertCountMatchesNotifications()
+        self.assertEqual(self.user.unread_notification_count, 0)
+
+    def test_email_flags_leave_count(self):
+        stale = self.notify()
+        self.client.patch(
+            f'/api/notifications/notifications/{stale.pk}/', {'is_read': True}, format='json'
+        )
+
+        NotificationService.send_email_notification(stale)
+
+        self.assertEqual(len(mail.outbox), 1)
+        stored = Notification.objects.get(pk=stale.pk)
+        self.assertTrue(stored.email_sent)
+        self.assertTrue(stored.is_read)
+        self.assertCountMatchesNotifications()
+
+    def test_email_worker_sends_stored_notification(self):
+        with mock.patch('notifications.services._email_executor') as executor:
+            with self.captureOnCommitCallbacks(execute=True):
+                notification = NotificationService.create_notification(
+                    self.user, 'general', 'Hello', 'Hello'
+                )
+        (worker, *args), _ = executor.submit.call_args
+        self.client.patch(
+            f'/api/notifications/notifications/{notification.pk}/',
+            {'title': 'Updated', 'is_read': True}, format='json'
+        )
+
+        # The test's connection must stay open after the worker finishes
+        with mock.patch('notifications.services.connection'):
+            worker(*args)
+
+        self.assertEqual(mail.outbox[-1].subject, 'Updated')
+        self.assertTrue(Notification.objects.get(pk=notification.pk).email_sent)
+        self.assertCountMatchesNotifications()
+
+    def test_mark_read_actions(self):
+        notifications = [self.notify() for _ in range(3)]
+
+        with self.assertNumQueries(2):
+            # One UPDATE for the row and one for the counter
+            response = self.client.post(
+                f'/api/notifications/notifications/{notifications[0].pk}/mark_read/'
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(Notification.objects.get(pk=notifications[0].pk).is_read)
+        self.assertCountMatchesNotifications()
+
+        # Marking it again leaves the counter alone
+        response = self.client.post(
+            f'/api/notifications/notifications/{notifications[0].pk}/mark_read/'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertCountMatchesNotifications()
+
+        response = self.client.post('/api/notifications/notifications/0/mark_read/')
+        self.assertEqual(response.status_code, 404)
+
+        response = self.client.post('/api/notifications/notifications/mark_all_read/')
+        self.assertEqual(response.status_code, 200)
+        self.assertCountMatchesNotifications()
+        self.assertEqual(self.user.unread_notification_count, 0)
 
-# Create your tests here.
+    def test_create_is_not_allowed(self):
+        response = self.client.post(
+            '/api/notifications/notifications/',
+            {'notification_type': 'general', 'title': 'Hi', 'message': 'Hi'}, format='json'
+        )
+        self.assertEqual(response.status_code, 405)
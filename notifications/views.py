@@ -1,13 +1,17 @@
-from rest_framework import viewsets, filters
+from rest_framework import filters, mixins, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
 from .models import Notification
 from .serializers import NotificationSerializer
+from .signals import adjust_unread_count
 
 
-class NotificationViewSet(viewsets.ModelViewSet):
+class NotificationViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
+                          mixins.UpdateModelMixin, mixins.DestroyModelMixin,
+                          viewsets.GenericViewSet):
     """ViewSet for managing notifications."""
     
     queryset = Notification.objects.all()
@@ -15,7 +19,9 @@ class NotificationViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     filter_backends = [filters.OrderingFilter]
     ordering = ['-created_at']
-    http_method_names = ['get', 'patch', 'delete']
+    # Notifications are only created by NotificationService; POST is for
+    # the mark_read/mark_all_read actions
+    http_method_names = ['get', 'post', 'patch', 'delete']
     
     def get_queryset(self):
         return Notification.objects.filter(user=self.request.user)
@@ -32,19 +38,29 @@ class NotificationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def unread_count(self, request):
         """Get count of unread notifications."""
-        count = self.get_queryset().filter(is_read=False).count()
-        return Response({'unread_count': count})
+        return Response({'unread_count': request.user.unread_notification_count})
     
     @action(detail=True, methods=['post'])
     def mark_read(self, request, pk=None):
         """Mark a notification as read."""
-        notification = self.get_object()
-        notification.is_read = True
-        notification.save()
+        # One UPDATE instead of fetching the row and saving it through the
+        # pre_save/post_save counter signals
+        try:
+            notifications = self.get_queryset().filter(pk=int(pk))
+        except ValueError:
+            raise NotFound()
+        updated = notifications.filter(is_read=False).update(is_read=True)
+        if updated:
+            adjust_unread_count(request.user.pk, -updated)
+        elif not notifications.exists():
+            raise NotFound()
         return Response({'message': 'Notification marked as read'})
     
     @action(detail=False, methods=['post'])
     def mark_all_read(self, request):
         """Mark all notifications as read."""
-        self.get_queryset().filter(is_read=False).update(is_read=True)
+        updated = self.get_queryset().filter(is_read=False).update(is_read=True)
+        # Bulk updates skip the Notification signals
+        if updated:
+            adjust_unread_count(request.user.pk, -updated)
         return Response({'message': 'All notifications marked as read'})
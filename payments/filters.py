@@ -1,8 +1,9 @@
 import django_filters
 from .models import Payment
+from accounts.filters import CachedFormMixin
 
 
-class PaymentFilter(django_filters.FilterSet):
+class PaymentFilter(CachedFormMixin, django_filters.FilterSet):
     """Filter for Payment model."""
     
     # Date range filters
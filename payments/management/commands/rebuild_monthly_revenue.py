@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from payments.models import MonthlyRevenue
+
+
+class Command(BaseCommand):
+    help = 'Recompute monthly revenue totals from completed payments.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--owner', type=int, action='append', dest='owners',
+            help='Only rebuild this owner profile id (repeatable)'
+        )
+    
+    def handle(self, *args, owners=None, **options):
+        with transaction.atomic():
+            MonthlyRevenue.rebuild(owners=owners)
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {MonthlyRevenue.objects.count()} monthly revenue rows.'
+        ))
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:19
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth
+
+
+def backfill_monthly_revenue(apps, schema_editor):
+    Payment = apps.get_model('payments', 'Payment')
+    MonthlyRevenue = apps.get_model('payments', 'MonthlyRevenue')
+    totals = Payment.objects.filter(
+        payment_status='completed', payment_date__isnull=False
+    ).annotate(
+        month=TruncMonth('payment_date')
+    ).order_by().values('owner_id', 'month').annotate(amount=Sum('amount'))
+    MonthlyRevenue.objects.bulk_create([MonthlyRevenue(**total) for total in totals])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('payments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyRevenue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='First day of the month')),
+                ('amount', models.DecimalField(decimal_places=2, default=Decimal('0'), max_digits=15)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_revenue', to='accounts.owner')),
+            ],
+            options={
+                'ordering': ['-month'],
+                'unique_together': {('owner', 'month')},
+            },
+        ),
+        migrations.RunPython(backfill_monthly_revenue, migrations.RunPython.noop),
+    ]
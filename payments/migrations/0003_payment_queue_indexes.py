@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0002_monthlyrevenue'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(condition=models.Q(('payment_status', 'pending')), fields=['due_date'], name='pay_pending_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(condition=models.Q(('payment_status', 'pending_verification')), fields=['due_date'], name='pay_pending_verif_due_idx'),
+        ),
+    ]
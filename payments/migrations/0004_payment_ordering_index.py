@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0003_payment_queue_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['-due_date', '-id'], name='pay_due_id_idx'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 from django.core.validators import MinValueValidator
 from decimal import Decimal
 from accounts.models import User, Tenant, Owner
@@ -58,6 +59,19 @@ class Payment(models.Model):
     
     class Meta:
         ordering = ['-due_date', '-created_at']
+        indexes = [
+            # Matches PaymentViewSet's keyset ordering
+            models.Index(fields=['-due_date', '-id'], name='pay_due_id_idx'),
+            # Partial indexes for the pending/overdue and verification queues
+            models.Index(
+                fields=['due_date'], name='pay_pending_due_idx',
+                condition=Q(payment_status='pending')
+            ),
+            models.Index(
+                fields=['due_date'], name='pay_pending_verif_due_idx',
+                condition=Q(payment_status='pending_verification')
+            ),
+        ]
     
     def __str__(self):
         return f"Payment: {self.tenant.user.get_full_name()} - TZS {self.amount}"
@@ -76,3 +90,38 @@ class Payment(models.Model):
         random_digits = random.randint(1000, 9999)
         self.receipt_number = f"RCP-{timestamp}-{random_digits}"
         return self.receipt_number
+
+
+class MonthlyRevenue(models.Model):
+    """Completed payment totals per owner and month, kept in sync by signals."""
+    
+    owner = models.ForeignKey(Owner, on_delete=models.CASCADE, related_name='monthly_revenue')
+    month = models.DateField(help_text='First day of the month')
+    amount = models.DecimalField(max_digits=15, decimal_places=2, default=Decimal('0'))
+    
+    class Meta:
+        unique_together = ['owner', 'month']
+        ordering = ['-month']
+    
+    def __str__(self):
+        return f"{self.owner} - {self.month:%Y-%m}: TZS {self.amount}"
+    
+    @classmethod
+    def rebuild(cls, owners=None):
+        """Recompute the monthly totals from completed payments."""
+        from django.db.models import Sum
+        from django.db.models.functions import TruncMonth
+        
+        payments = Payment.objects.filter(
+            payment_status='completed', payment_date__isnull=False
+        )
+        rows = cls.objects.all()
+        if owners is not None:
+            payments = payments.filter(owner__in=owners)
+            rows = rows.filter(owner__in=owners)
+        totals = payments.annotate(
+            month=TruncMonth('payment_date')
+        ).order_by().values('owner_id', 'month').annotate(amount=Sum('amount'))
+        
+        rows.delete()
+        cls.objects.bulk_create([cls(**total) for total in totals])
@@ -1,12 +1,16 @@
 from rest_framework import serializers
 from .models import Payment
-from accounts.serializers import TenantListSerializer, OwnerListSerializer
+from accounts.serializers import TenantListSerializer, OwnerListSerializer, CachedFieldsMixin, FastListSerializer
+from accounts.fields import FastChoiceField
 from leases.models import LeaseAgreement
 
 
+_VERIFICATION_ACTIONS = frozenset(['approve', 'reject'])
+
+
 # ==================== Payment Serializers ====================
 
-class PaymentListSerializer(serializers.ModelSerializer):
+class PaymentListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Minimal payment data for listings."""
     tenant_name = serializers.SerializerMethodField()
     property_title = serializers.CharField(
@@ -25,6 +29,20 @@ class PaymentListSerializer(serializers.ModelSerializer):
                   'payment_method', 'payment_method_display', 'payment_date',
                   'due_date', 'payment_period', 'payment_status', 'status_display',
                   'is_late']
+        read_only_fields = fields
+        list_serializer_class = FastListSerializer
+    
+    @staticmethod
+    def setup_queryset(queryset):
+        """Join and load only the columns this serializer reads."""
+        return queryset.select_related(None).select_related(
+            'tenant__user', 'lease__unit__property'
+        ).only(
+            'id', 'amount', 'payment_method', 'payment_date', 'due_date',
+            'payment_period', 'payment_status',
+            'tenant__user__first_name', 'tenant__user__last_name',
+            'lease__unit__property__title'
+        )
     
     def get_tenant_name(self, obj):
         return obj.tenant.user.get_full_name()
@@ -88,6 +106,6 @@ class PaymentCreateSerializer(serializers.ModelSerializer):
 
 class PaymentVerificationSerializer(serializers.Serializer):
     """Serializer for verifying payments."""
-    action = serializers.ChoiceField(choices=['approve', 'reject'])
+    action = FastChoiceField(choices=_VERIFICATION_ACTIONS)
     notes = serializers.CharField(required=False, allow_blank=True)
     transaction_id = serializers.CharField(required=False, allow_blank=True)
@@ -0,0 +1,88 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .models import MonthlyRevenue, Payment
+
+
+def _revenue_key(status, payment_date, owner_id, amount):
+    """Return the (owner_id, month, amount) a payment adds to MonthlyRevenue."""
+    if status != 'completed' or not payment_date:
+        return None
+    return owner_id, payment_date.replace(day=1), amount
+
+
+def _add_revenue(owner_id, month, amount):
+    updated = MonthlyRevenue.objects.filter(owner_id=owner_id, month=month).update(
+        amount=F('amount') + amount
+    )
+    if not updated:
+        revenue, created = MonthlyRevenue.objects.get_or_create(
+            owner_id=owner_id, month=month, defaults={'amount': amount}
+        )
+        if not created:
+            # Lost a race with another first payment of the month
+            MonthlyRevenue.objects.filter(pk=revenue.pk).update(
+                amount=F('amount') + amount
+            )
+
+
+# Payment fields that decide its contribution to MonthlyRevenue, in
+# _revenue_key() argument order
+_REVENUE_FIELDS = ('payment_status', 'payment_date', 'owner_id', 'amount')
+
+
+def _written_revenue_fields(update_fields):
+    """Return the revenue fields a save with these update_fields writes."""
+    if update_fields is None:
+        return set(_REVENUE_FIELDS)
+    return {
+        field for field in _REVENUE_FIELDS
+        if field in update_fields or field.removesuffix('_id') in update_fields
+    }
+
+
+@receiver(pre_save, sender=Payment)
+@receiver(pre_delete, sender=Payment)
+def store_previous_revenue(sender, instance, **kwargs):
+    """Remember the stored revenue fields of the payment being written."""
+    instance._stored_revenue = None
+    # Only read the stored row when a revenue field is written
+    if instance.pk and _written_revenue_fields(kwargs.get('update_fields')):
+        instance._stored_revenue = Payment.objects.filter(pk=instance.pk).values_list(
+            *_REVENUE_FIELDS
+        ).first()
+
+
+@receiver(post_save, sender=Payment)
+def update_monthly_revenue(sender, instance, **kwargs):
+    """Apply the change in a payment's contribution to monthly revenue."""
+    written = _written_revenue_fields(kwargs.get('update_fields'))
+    if not written:
+        # The stored contribution is untouched, whatever the instance holds
+        return
+    stored = getattr(instance, '_stored_revenue', None)
+    # Fields this save did not write keep their stored value, even if the
+    # instance holds a stale one
+    values = [
+        getattr(instance, field) if stored is None or field in written else stored[i]
+        for i, field in enumerate(_REVENUE_FIELDS)
+    ]
+    old = _revenue_key(*stored) if stored else None
+    new = _revenue_key(*values)
+    if old == new:
+        return
+    if old:
+        _add_revenue(old[0], old[1], -old[2])
+    if new:
+        _add_revenue(*new)
+
+
+@receiver(post_delete, sender=Payment)
+def remove_monthly_revenue(sender, instance, **kwargs):
+    """Take a deleted completed payment out of monthly revenue."""
+    # Use the stored row rather than the instance, which may be stale
+    stored = getattr(instance, '_stored_revenue', None)
+    old = _revenue_key(*stored) if stored else None
+    if old:
+        _add_revenue(old[0], old[1], -old[2])
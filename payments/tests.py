@@ -1,3 +1,111 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from leases.models import LeaseAgreement
+from localities.models import LocalityLevel, Locality
+from properties.models import Property, RentalUnit
+from .models import MonthlyRevenue, Payment
+
+
+# ==================== Monthly Revenue ====================
+
+class MonthlyRevenueCounterTests(TestCase):
+    """MonthlyRevenue follows payments as they are verified, edited and deleted."""
+
+    def setUp(self):
+        self.owner_user = User.objects.create_user(
+            username='owner', password='pass12345!', user_type='owner',
+            phone_number='+255700000002'
+        )
+        tenant_user = User.objects.create_user(
+            username='tenant', password='pass12345!', user_type='tenant',
+            phone_number='+255700000001'
+        )
+        level = LocalityLevel.objects.create(name='Ward', slug='ward')
+        property_obj = Property.objects.create(
+            owner=self.owner_user.owner_profile, property_type='house', title='House',
+            description='A house', monthly_rent=Decimal('100'),
+            locality=Locality.objects.create(name='Ward 1', level=level)
+        )
+        unit = RentalUnit.objects.create(
+            property=property_obj, unit_type='single_room',
+            unit_number='1', unit_rent=Decimal('50')
+        )
+        today = timezone.now().date()
+        self.lease = LeaseAgreement.objects.create(
+            tenant=tenant_user.tenant_profile, unit=unit, start_date=today,
+            end_date=today + timedelta(days=365),
+            monthly_rent=Decimal('50'), security_deposit=Decimal('10')
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner_user)
+
+    def create_payment(self, amount, **extra):
+        return Payment.objects.create(
+            lease=self.lease, tenant=self.lease.tenant, owner=self.owner_user.owner_profile,
+            amount=Decimal(amount), payment_method='mpesa',
+            due_date=timezone.now().date(), payment_period='Rent', **extra
+        )
+
+    def verify(self, payment, action):
+        response = self.client.post(
+            f'/api/payments/payments/{payment.pk}/verify/', {'action': action}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def assertRevenueMatchesPayments(self):
+        totals = Payment.objects.filter(
+            payment_status='completed', payment_date__isnull=False
+        ).annotate(
+            month=TruncMonth('payment_date')
+        ).order_by().values('owner_id', 'month').annotate(amount=Sum('amount'))
+        expected = {(row['owner_id'], row['month']): row['amount'] for row in totals}
+        stored = {
+            (row.owner_id, row.month): row.amount
+            for row in MonthlyRevenue.objects.exclude(amount=0)
+        }
+        self.assertEqual(stored, expected)
+
+    def test_verify_edit_and_delete(self):
+        earlier = self.create_payment(
+            '70', payment_status='completed', payment_date=date(2025, 3, 15)
+        )
+        self.create_payment('30', payment_status='completed', payment_date=date(2025, 3, 2))
+        approved = self.create_payment('50', payment_status='pending_verification')
+        rejected = self.create_payment('40', payment_status='pending_verification')
+        self.assertRevenueMatchesPayments()
+
+        self.verify(approved, 'approve')
+        self.verify(rejected, 'reject')
+        self.assertRevenueMatchesPayments()
+
+        earlier.amount = Decimal('90')
+        earlier.payment_date = date(2025, 4, 1)
+        earlier.save()
+        self.assertRevenueMatchesPayments()
+
+        earlier.delete()
+        approved.delete()
+        self.assertRevenueMatchesPayments()
+
+    def test_save_without_revenue_fields_leaves_revenue(self):
+        stale = self.create_payment('50', payment_status='pending_verification')
+        self.verify(stale, 'approve')
+        self.assertRevenueMatchesPayments()
+
+        stale.notes = 'Checked'
+        stale.save(update_fields=['notes', 'updated_at'])
+        self.assertRevenueMatchesPayments()
 
-# Create your tests here.
+        # A status-only save keeps the stored amount, not the stale one
+        stale.amount = Decimal('999')
+        stale.payment_status = 'refunded'
+        stale.save(update_fields=['payment_status'])
+        self.assertRevenueMatchesPayments()
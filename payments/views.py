@@ -1,8 +1,9 @@
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 
 from .models import Payment
@@ -11,11 +12,13 @@ from .serializers import (
     PaymentVerificationSerializer
 )
 from .filters import PaymentFilter
-from accounts.permissions import IsOwnerOrAdmin
+from accounts.mixins import ProfileCacheMixin
+from accounts.pagination import KeysetPagination
+from accounts.permissions import IsOwnerOrAdmin, IS_AUTHENTICATED
 from notifications.services import NotificationService
 
 
-class PaymentViewSet(viewsets.ModelViewSet):
+class PaymentViewSet(ProfileCacheMixin, viewsets.ModelViewSet):
     """ViewSet for managing payments."""
     
     queryset = Payment.objects.all()
@@ -23,8 +26,11 @@ class PaymentViewSet(viewsets.ModelViewSet):
     filterset_class = PaymentFilter
     search_fields = ['tenant__user__first_name', 'tenant__user__last_name',
                      'transaction_id', 'mobile_money_code', 'receipt_number']
-    ordering_fields = ['payment_date', 'due_date', 'amount', 'created_at']
-    ordering = ['-due_date']
+    # Keyset pages seek on the first ordering column, so it must not be
+    # nullable; payment_date is left out for that reason
+    ordering_fields = ['due_date', 'amount', 'created_at']
+    ordering = ['-due_date', '-id']
+    pagination_class = KeysetPagination
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -34,32 +40,36 @@ class PaymentViewSet(viewsets.ModelViewSet):
         return PaymentSerializer
     
     def get_permissions(self):
-        return [IsAuthenticated()]
+        return IS_AUTHENTICATED
+    
+    # Actions rendering PaymentListSerializer get its narrowed queryset
+    list_actions = ('list', 'pending', 'pending_verification', 'overdue')
     
     def get_queryset(self):
         user = self.request.user
+        queryset = Payment.objects.select_related(
+            'tenant__user', 'owner__user', 'lease__unit__property', 'verified_by'
+        )
+        if self.action in self.list_actions:
+            queryset = PaymentListSerializer.setup_queryset(queryset)
         if user.is_staff:
-            return Payment.objects.all()
-        
-        queryset = Payment.objects.none()
+            return queryset
         
+        visible = Q()
         if hasattr(user, 'tenant_profile'):
-            queryset = queryset | Payment.objects.filter(
-                tenant=user.tenant_profile
-            )
-        
+            visible |= Q(tenant=user.tenant_profile)
         if hasattr(user, 'owner_profile'):
-            queryset = queryset | Payment.objects.filter(
-                owner=user.owner_profile
-            )
-        
-        return queryset.distinct()
+            visible |= Q(owner=user.owner_profile)
+        if not visible:
+            return queryset.none()
+        return queryset.filter(visible)
     
     def perform_create(self, serializer):
-        payment = serializer.save()
-        
-        # Send notification to owner
-        NotificationService.send_payment_received(payment)
+        with transaction.atomic():
+            payment = serializer.save()
+            
+            # Send notification to owner
+            NotificationService.send_on_commit('payment_received', payment)
     
     @action(detail=True, methods=['post'], permission_classes=[IsOwnerOrAdmin])
     def verify(self, request, pk=None):
@@ -70,33 +80,39 @@ class PaymentViewSet(viewsets.ModelViewSet):
         
         action_type = serializer.validated_data['action']
         
-        if action_type == 'approve':
-            payment.payment_status = 'completed'
-            payment.verified_by = request.user
-            payment.verified_at = timezone.now()
-            if not payment.payment_date:
-                payment.payment_date = timezone.now().date()
-            payment.generate_receipt_number()
-            
-            if serializer.validated_data.get('transaction_id'):
-                payment.transaction_id = serializer.validated_data['transaction_id']
-            
-            # Update owner earnings
-            owner = payment.owner
-            owner.total_earnings += payment.amount
-            owner.save(update_fields=['total_earnings'])
+        with transaction.atomic():
+            if action_type == 'approve':
+                payment.payment_status = 'completed'
+                payment.verified_by = request.user
+                payment.verified_at = timezone.now()
+                if not payment.payment_date:
+                    payment.payment_date = payment.verified_at.date()
+                payment.generate_receipt_number()
+                
+                if serializer.validated_data.get('transaction_id'):
+                    payment.transaction_id = serializer.validated_data['transaction_id']
+                update_fields = [
+                    'payment_status', 'verified_by', 'verified_at', 'payment_date',
+                    'receipt_number', 'transaction_id', 'updated_at'
+                ]
+                
+                # Update owner earnings
+                owner = payment.owner
+                owner.total_earnings += payment.amount
+                owner.save(update_fields=['total_earnings'])
+                
+                # Send notification
+                NotificationService.send_on_commit('payment_verified', payment)
+                
+            else:  # reject
+                payment.payment_status = 'failed'
+                payment.notes = serializer.validated_data.get('notes', '')
+                update_fields = ['payment_status', 'notes', 'updated_at']
+                
+                # Send notification
+                NotificationService.send_on_commit('payment_rejected', payment)
             
-            # Send notification
-            NotificationService.send_payment_verified(payment)
-            
-        else:  # reject
-            payment.payment_status = 'failed'
-            payment.notes = serializer.validated_data.get('notes', '')
-            
-            # Send notification
-            NotificationService.send_payment_rejected(payment)
-        
-        payment.save()
+            payment.save(update_fields=update_fields)
         return Response(PaymentSerializer(payment).data)
     
     @action(detail=False, methods=['get'])
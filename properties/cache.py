@@ -0,0 +1,21 @@
+from accounts.cache import bump_versions, get_or_compute
+
+
+# ==================== Available Listings Cache ====================
+
+# Counters updated in bulk (available rooms, ratings via reviews) do not
+# all go through signals, so keep the timeout short.
+AVAILABLE_CACHE_TIMEOUT = 60 * 5
+AVAILABLE_VERSION_KEY = 'properties:available:v'
+
+
+def get_cached_available(request, compute):
+    """Return the cached available-properties listing for this host."""
+    # Image URLs are absolute, so the scheme and host are part of the key
+    key = f'properties:available:{request.scheme}:{request.get_host()}'
+    return get_or_compute(key, AVAILABLE_VERSION_KEY, compute, AVAILABLE_CACHE_TIMEOUT)
+
+
+def invalidate_available():
+    """Drop every cached available-properties listing."""
+    bump_versions([AVAILABLE_VERSION_KEY])
@@ -1,8 +1,10 @@
 import django_filters
-from .models import Property, RentalUnit
+from django.db.models import Exists, OuterRef
+from .models import Property, PropertyAmenity, RentalUnit
+from accounts.filters import CachedFormMixin
 
 
-class PropertyFilter(django_filters.FilterSet):
+class PropertyFilter(CachedFormMixin, django_filters.FilterSet):
     """Filter for Property model with Tanzanian-specific fields."""
     
     # Rent range
@@ -57,12 +59,15 @@ class PropertyFilter(django_filters.FilterSet):
     def filter_by_amenities(self, queryset, name, value):
         """Filter properties that have all specified amenities."""
         amenity_list = value.split(',')
+        # One EXISTS per amenity instead of chained joins plus DISTINCT
         for amenity in amenity_list:
-            queryset = queryset.filter(amenities__amenity=amenity.strip())
-        return queryset.distinct()
+            queryset = queryset.filter(Exists(PropertyAmenity.objects.filter(
+                property=OuterRef('pk'), amenity=amenity.strip()
+            )))
+        return queryset
 
 
-class RentalUnitFilter(django_filters.FilterSet):
+class RentalUnitFilter(CachedFormMixin, django_filters.FilterSet):
     """Filter for RentalUnit model."""
     
     # Property filter
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:16
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_unit_counts(apps, schema_editor):
+    Property = apps.get_model('properties', 'Property')
+    RentalUnit = apps.get_model('properties', 'RentalUnit')
+    counts = RentalUnit.objects.filter(
+        property=OuterRef('pk')
+    ).order_by().values('property')
+    Property.objects.update(
+        total_units=Coalesce(Subquery(
+            counts.annotate(count=Count('pk')).values('count')
+        ), 0),
+        occupied_units=Coalesce(Subquery(
+            counts.annotate(
+                count=Count('pk', filter=Q(is_occupied=True))
+            ).values('count')
+        ), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='occupied_units',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='total_units',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_unit_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0002_property_unit_counts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['-listed_date'], name='prop_listed_date_idx'),
+        ),
+    ]
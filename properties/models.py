@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Avg
 from django.core.validators import MinValueValidator
 from decimal import Decimal
 from accounts.models import Owner
@@ -31,6 +32,9 @@ class Property(models.Model):
     locality = models.OneToOneField(Locality, on_delete=models.CASCADE, related_name='property')
     total_rooms = models.PositiveIntegerField(default=1)
     available_rooms = models.PositiveIntegerField(default=1)
+    # Unit counts kept in sync by the RentalUnit signals
+    total_units = models.PositiveIntegerField(default=0, editable=False)
+    occupied_units = models.PositiveIntegerField(default=0, editable=False)
     is_available = models.BooleanField(default=True)
     listed_date = models.DateField(auto_now_add=True)
     rules_terms = models.TextField(blank=True, help_text='Property rules and terms')
@@ -40,16 +44,20 @@ class Property(models.Model):
     class Meta:
         verbose_name_plural = 'Properties'
         ordering = ['-listed_date']
+        indexes = [
+            models.Index(fields=['-listed_date'], name='prop_listed_date_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.locality}"
     
     @property
     def average_rating(self):
-        reviews = self.reviews.all()
-        if reviews.exists():
-            return sum(r.rating for r in reviews) / reviews.count()
-        return None
+        # Listing querysets annotate the average instead of querying per row
+        if hasattr(self, 'rating_average'):
+            return self.rating_average
+        # AVG over no rows is NULL, so no separate existence check is needed
+        return self.reviews.aggregate(average=Avg('rating'))['average']
 
 
 class PropertyImage(models.Model):
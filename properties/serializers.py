@@ -1,6 +1,8 @@
+from django.db import models, transaction
+from django.utils.encoding import iri_to_uri
 from rest_framework import serializers
 from .models import Property, PropertyImage, PropertyAmenity, RentalUnit
-from accounts.serializers import OwnerListSerializer
+from accounts.serializers import OwnerListSerializer, CachedFieldsMixin, FastListSerializer, ReadableFieldsMixin
 from localities.serializers import LocalitySerializer
 
 
@@ -24,7 +26,7 @@ class PropertyAmenitySerializer(serializers.ModelSerializer):
         fields = ['id', 'amenity', 'amenity_display']
 
 
-class RentalUnitListSerializer(serializers.ModelSerializer):
+class RentalUnitListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Minimal rental unit data."""
     unit_type_display = serializers.CharField(source='get_unit_type_display', read_only=True)
     
@@ -32,6 +34,8 @@ class RentalUnitListSerializer(serializers.ModelSerializer):
         model = RentalUnit
         fields = ['id', 'unit_number', 'unit_type', 'unit_type_display',
                   'unit_rent', 'is_occupied']
+        read_only_fields = fields
+        list_serializer_class = FastListSerializer
 
 
 class RentalUnitSerializer(serializers.ModelSerializer):
@@ -60,10 +64,99 @@ class RentalUnitSerializer(serializers.ModelSerializer):
         return None
 
 
-class PropertyListSerializer(serializers.ModelSerializer):
-    """Minimal property data for listings."""
+def _rating_average():
+    """Subquery for a property's average review rating (read by average_rating)."""
+    from django.db.models import Avg, OuterRef, Subquery
+    from reviews.models import Review
+    
+    return Subquery(Review.objects.filter(
+        property=OuterRef('pk')
+    ).order_by().values('property').annotate(avg=Avg('rating')).values('avg'))
+
+
+def _visible_reviews_count():
+    """Subquery counting a property's visible reviews, zero when there are none."""
+    from django.db.models import Count, OuterRef, Subquery
+    from django.db.models.functions import Coalesce
+    from reviews.models import Review
+    
+    return Coalesce(Subquery(Review.objects.filter(
+        property=OuterRef('pk'), is_visible=True
+    ).order_by().values('property').annotate(count=Count('pk')).values('count')), 0)
+
+
+class PropertyRowListSerializer(FastListSerializer):
+    """
+    Renders PropertyListSerializer.setup_values() rows without model instances.
+    
+    The output keys come from the child's readable fields, and each value
+    still goes through that field's to_representation(), so the output is
+    the same as for model rows. Method fields are read by the matching
+    read_<field name>() method below. Model instances are handed on to
+    FastListSerializer.
+    """
+    # setup_values() column for each child field source that is not a
+    # model column of the same name
+    source_aliases = {
+        'locality.name': 'locality_name',
+        'average_rating': 'rating_average',
+    }
+    
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        rows = list(iterable)
+        if not rows or not isinstance(rows[0], dict):
+            return super().to_representation(rows)
+        
+        readers = [
+            (field.field_name, self._row_reader(field))
+            for field in self.child._readable_fields
+        ]
+        return [{name: read(row) for name, read in readers} for row in rows]
+    
+    def _row_reader(self, field):
+        """Return a function reading `field`'s output value from a values row."""
+        if isinstance(field, serializers.SerializerMethodField):
+            return getattr(self, 'read_%s' % field.field_name)
+        
+        source = field.source
+        if source.startswith('get_') and source.endswith('_display'):
+            model_field = self.child.Meta.model._meta.get_field(source[4:-8])
+            labels = dict(model_field.flatchoices)
+            column = model_field.attname
+            return lambda row: str(labels.get(row[column], row[column]))
+        
+        column = self.source_aliases.get(source, source)
+        to_representation = field.to_representation
+        
+        def read(row):
+            value = row[column]
+            return None if value is None else to_representation(value)
+        return read
+    
+    def read_owner_name(self, row):
+        return ('%s %s' % (row['owner_first_name'], row['owner_last_name'])).strip()
+    
+    def read_primary_image(self, row):
+        image_name = row['primary_image_name']
+        if not image_name:
+            return None
+        storage = PropertyImage._meta.get_field('image').storage
+        return self.child._build_absolute_url(storage.url(image_name))
+
+
+class PropertyListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Minimal property data for listings.
+    
+    Querysets passed to this serializer should go through setup_queryset(),
+    which narrows the columns with .only() and loads primary images and
+    ratings in bulk, or setup_values() for read-only lists of plain rows.
+    New fields need their column in both; PropertyRowListSerializer maps
+    sources that setup_values() renames through source_aliases.
+    """
     owner_name = serializers.SerializerMethodField()
-    locality = serializers.SerializerMethodField()
+    locality = serializers.CharField(source='locality.name', read_only=True)
     property_type_display = serializers.CharField(
         source='get_property_type_display', read_only=True
     )
@@ -75,24 +168,81 @@ class PropertyListSerializer(serializers.ModelSerializer):
                   'monthly_rent', 'locality', 'owner_name',
                   'available_rooms', 'total_rooms', 'is_available',
                   'average_rating', 'primary_image', 'listed_date']
+        read_only_fields = fields
+        list_serializer_class = PropertyRowListSerializer
+    
+    @staticmethod
+    def setup_queryset(queryset):
+        """Load everything the listing renders in a constant number of queries."""
+        from django.db.models import Prefetch
+        
+        return queryset.select_related('owner__user', 'locality').only(
+            'id', 'title', 'property_type', 'monthly_rent',
+            'available_rooms', 'total_rooms', 'is_available',
+            'listed_date', 'locality__name',
+            'owner__user__first_name', 'owner__user__last_name'
+        ).prefetch_related(
+            Prefetch(
+                'images',
+                queryset=PropertyImage.objects.filter(is_primary=True).only(
+                    'id', 'property_id', 'image'
+                ),
+                to_attr='primary_images'
+            )
+        ).annotate(rating_average=_rating_average())
+    
+    @staticmethod
+    def setup_values(queryset):
+        """
+        Like setup_queryset(), but yield plain dicts instead of instances.
+        
+        The primary image comes from a subquery, so the whole listing is a
+        single query. The result can still be filtered, ordered and paginated.
+        """
+        from django.db.models import F, OuterRef, Subquery
+        
+        primary_image = PropertyImage.objects.filter(
+            property=OuterRef('pk'), is_primary=True
+        ).values('image')[:1]
+        return PropertyListSerializer.setup_queryset(queryset).prefetch_related(
+            None
+        ).annotate(
+            primary_image_name=Subquery(primary_image)
+        ).values(
+            'id', 'title', 'property_type', 'monthly_rent',
+            'available_rooms', 'total_rooms', 'is_available', 'listed_date',
+            'rating_average', 'primary_image_name',
+            locality_name=F('locality__name'),
+            owner_first_name=F('owner__user__first_name'),
+            owner_last_name=F('owner__user__last_name'),
+        )
     
     def get_owner_name(self, obj):
         return obj.owner.user.get_full_name()
     
-    def get_locality(self, obj):
-        return f"{obj.locality}"
-    
     def get_primary_image(self, obj):
-        primary = obj.images.filter(is_primary=True).first()
+        primary_images = getattr(obj, 'primary_images', None)
+        if primary_images is None:
+            primary = obj.images.filter(is_primary=True).first()
+        else:
+            primary = primary_images[0] if primary_images else None
         if primary:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(primary.image.url)
-            return primary.image.url
+            return self._build_absolute_url(primary.image.url)
         return None
+    
+    def _build_absolute_url(self, url):
+        request = self.context.get('request')
+        if not request:
+            return url
+        if not url.startswith('/') or url.startswith('//'):
+            return request.build_absolute_uri(url)
+        # scheme://host is resolved once and shared through the context
+        if '_url_base' not in self.context:
+            self.context['_url_base'] = request.build_absolute_uri('/')[:-1]
+        return iri_to_uri(self.context['_url_base'] + url)
 
 
-class PropertySerializer(serializers.ModelSerializer):
+class PropertySerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """Full property details."""
     from accounts.models import Owner
     
@@ -119,7 +269,28 @@ class PropertySerializer(serializers.ModelSerializer):
                   'reviews_count', 'created_at', 'updated_at']
         read_only_fields = ['id', 'listed_date', 'created_at', 'updated_at']
     
+    @staticmethod
+    def setup_queryset(queryset):
+        """Load a property's details, ratings and related rows in bulk."""
+        from django.db.models import Prefetch
+        
+        return queryset.select_related(
+            'owner__user', 'locality__level', 'locality__parent'
+        ).prefetch_related(
+            # Primary image first, in a single prefetch query
+            Prefetch(
+                'images',
+                queryset=PropertyImage.objects.order_by('-is_primary', '-uploaded_at')
+            ),
+            'amenities', 'units'
+        ).annotate(
+            rating_average=_rating_average(),
+            visible_reviews_count=_visible_reviews_count()
+        )
+    
     def get_reviews_count(self, obj):
+        if hasattr(obj, 'visible_reviews_count'):
+            return obj.visible_reviews_count
         return obj.reviews.filter(is_visible=True).count()
     
     def create(self, validated_data):
@@ -155,6 +326,7 @@ class PropertyCreateSerializer(serializers.ModelSerializer):
                   'locality', 'total_rooms', 'available_rooms', 'rules_terms',
                   'amenities']
     
+    @transaction.atomic
     def create(self, validated_data):
         from localities.models import Locality
         locality_data = validated_data.pop('locality')
@@ -171,7 +343,9 @@ class PropertyCreateSerializer(serializers.ModelSerializer):
         )
         
         # Create amenities
-        for amenity_code in amenities_data:
-            PropertyAmenity.objects.create(property=property_obj, amenity=amenity_code)
+        PropertyAmenity.objects.bulk_create([
+            PropertyAmenity(property=property_obj, amenity=amenity_code)
+            for amenity_code in amenities_data
+        ])
         
         return property_obj
@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_available
+from .models import Property, PropertyImage, RentalUnit
+
+
+@receiver(post_save, sender=Property)
+@receiver(post_delete, sender=Property)
+@receiver(post_save, sender=PropertyImage)
+@receiver(post_delete, sender=PropertyImage)
+@receiver(post_save, sender=RentalUnit)
+@receiver(post_delete, sender=RentalUnit)
+@receiver(post_save, sender='leases.LeaseAgreement')
+@receiver(post_save, sender='reviews.Review')
+@receiver(post_delete, sender='reviews.Review')
+def invalidate_available_listing(sender, **kwargs):
+    """Drop the cached available listing when anything it shows changes."""
+    invalidate_available()
@@ -1,3 +1,147 @@
-from django.test import TestCase
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.models import Count, Q
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import User
+from leases.models import LeaseAgreement
+from localities.models import LocalityLevel, Locality
+from .models import Property, PropertyImage, RentalUnit
+from .serializers import PropertyListSerializer
+
+
+# ==================== Unit Counters ====================
+
+class PropertyUnitCountTests(TestCase):
+    """Property unit counters follow the units, not the values it was created with."""
+
+    def setUp(self):
+        user = User.objects.create_user(
+            username='owner', password='pass12345!', user_type='owner',
+            phone_number='+255700000002'
+        )
+        level = LocalityLevel.objects.create(name='Ward', slug='ward')
+        self.property = Property.objects.create(
+            owner=user.owner_profile, property_type='house', title='House',
+            description='A house', monthly_rent=Decimal('100'),
+            locality=Locality.objects.create(name='Ward 1', level=level),
+            total_rooms=1, available_rooms=1
+        )
+
+    def create_unit(self, number, **extra):
+        return RentalUnit.objects.create(
+            property=self.property, unit_type='single_room',
+            unit_number=number, unit_rent=Decimal('50'), **extra
+        )
+
+    def assertCounts(self, available, occupied, total):
+        self.property.refresh_from_db()
+        self.assertEqual(
+            (self.property.available_rooms, self.property.occupied_units,
+             self.property.total_units),
+            (available, occupied, total)
+        )
+
+    def test_new_units_replace_initial_available_rooms(self):
+        for number in ('1', '2', '3'):
+            self.create_unit(number)
+        self.assertCounts(available=3, occupied=0, total=3)
+
+    def test_occupancy_flip_and_delete(self):
+        units = [self.create_unit(number) for number in ('1', '2', '3')]
+
+        units[0].is_occupied = True
+        units[0].save()
+        self.assertCounts(available=2, occupied=1, total=3)
+
+        units[0].delete()
+        self.assertCounts(available=2, occupied=0, total=2)
+
+        units[1].delete()
+        units[2].delete()
+        self.assertCounts(available=0, occupied=0, total=0)
+
+    def assertCountsMatchUnits(self):
+        expected = self.property.units.aggregate(
+            total=Count('pk'), occupied=Count('pk', filter=Q(is_occupied=True))
+        )
+        self.assertCounts(
+            available=expected['total'] - expected['occupied'],
+            occupied=expected['occupied'], total=expected['total']
+        )
+
+    def test_counts_match_units_through_leases(self):
+        tenant = User.objects.create_user(
+            username='tenant', password='pass12345!', user_type='tenant',
+            phone_number='+255700000001'
+        ).tenant_profile
+        units = [self.create_unit(number) for number in ('1', '2', '3', '4')]
+        self.assertCountsMatchUnits()
+
+        today = timezone.now().date()
+        leases = []
+        with self.captureOnCommitCallbacks(execute=True):
+            for unit in units[:3]:
+                leases.append(LeaseAgreement.objects.create(
+                    tenant=tenant, unit=unit, start_date=today,
+                    end_date=today + timedelta(days=30), status='active',
+                    monthly_rent=Decimal('50'), security_deposit=Decimal('10')
+                ))
+        self.assertCountsMatchUnits()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            leases[0].status = 'terminated'
+            leases[0].save()
+        self.assertCountsMatchUnits()
+
+        RentalUnit.objects.get(pk=units[1].pk).delete()
+        units[3].is_occupied = True
+        units[3].save()
+        self.assertCountsMatchUnits()
+
+        self.create_unit('5')
+        units[0].delete()
+        self.assertCountsMatchUnits()
+
+
+# ==================== Listing Rows ====================
+
+class PropertyRowListTests(TestCase):
+    """setup_values() rows render the same as model instances."""
+
+    def setUp(self):
+        user = User.objects.create_user(
+            username='owner', password='pass12345!', user_type='owner',
+            phone_number='+255700000002', first_name='Asha', last_name='Said'
+        )
+        level = LocalityLevel.objects.create(name='Ward', slug='ward')
+        for i in range(2):
+            Property.objects.create(
+                owner=user.owner_profile, property_type='apartment',
+                title=f'Flat {i}', description='A flat', monthly_rent=Decimal('100'),
+                locality=Locality.objects.create(name=f'Ward {i}', level=level)
+            )
+
+    @override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+    def test_rows_match_instances(self):
+        PropertyImage.objects.create(
+            property=Property.objects.first(), is_primary=True,
+            image=SimpleUploadedFile('front.jpg', b'image', content_type='image/jpeg')
+        )
+        context = {'request': RequestFactory().get('/')}
+        queryset = Property.objects.order_by('pk')
+
+        rows = PropertyListSerializer(
+            PropertyListSerializer.setup_values(queryset), many=True, context=context
+        ).data
+        instances = PropertyListSerializer(
+            list(PropertyListSerializer.setup_queryset(queryset)), many=True, context=context
+        ).data
+
+        self.assertEqual(rows, instances)
+        self.assertEqual(list(rows[0]), PropertyListSerializer.Meta.fields)
+        self.assertIsNotNone(rows[0]['primary_image'])
@@ -1,10 +1,11 @@
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
 from django_filters.rest_framework import DjangoFilterBackend
 
+from .cache import get_cached_available
 from .models import Property, PropertyImage, PropertyAmenity, RentalUnit
 from .serializers import (
     PropertySerializer, PropertyListSerializer, PropertyCreateSerializer,
@@ -12,7 +13,7 @@ from .serializers import (
     RentalUnitSerializer, RentalUnitListSerializer
 )
 from .filters import PropertyFilter, RentalUnitFilter
-from accounts.permissions import IsOwner, IsPropertyOwner
+from accounts.permissions import ALLOW_ANY, IS_AUTHENTICATED, IS_OWNER, IS_PROPERTY_OWNER
 
 
 class PropertyViewSet(viewsets.ModelViewSet):
@@ -34,29 +35,39 @@ class PropertyViewSet(viewsets.ModelViewSet):
     
     def get_permissions(self):
         if self.action in ['list', 'retrieve']:
-            return [AllowAny()]
+            return ALLOW_ANY
         if self.action == 'create':
-            return [IsOwner()]
-        return [IsPropertyOwner()]
+            return IS_OWNER
+        return IS_PROPERTY_OWNER
     
     def get_queryset(self):
         queryset = Property.objects.select_related('owner', 'locality')
         
+        if self.action == 'retrieve':
+            queryset = PropertySerializer.setup_queryset(queryset)
+        
         # Filter by owner if specified
         owner_only = self.request.query_params.get('my_properties')
         if owner_only and hasattr(self.request.user, 'owner_profile'):
             queryset = queryset.filter(owner=self.request.user.owner_profile)
         
+        if self.action == 'list':
+            queryset = PropertyListSerializer.setup_values(queryset)
         return queryset
     
     @action(detail=False, methods=['get'])
     def available(self, request):
         """Get all available properties."""
-        properties = Property.objects.filter(is_available=True)
-        serializer = PropertyListSerializer(
-            properties, many=True, context={'request': request}
-        )
-        return Response(serializer.data)
+        def compute():
+            properties = PropertyListSerializer.setup_values(
+                Property.objects.filter(is_available=True)
+            )
+            serializer = PropertyListSerializer(
+                properties, many=True, context={'request': request}
+            )
+            return serializer.data
+        
+        return Response(get_cached_available(request, compute))
     
     @action(detail=True, methods=['get'])
     def units(self, request, pk=None):
@@ -69,9 +80,14 @@ class PropertyViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['get'])
     def reviews(self, request, pk=None):
         """Get all reviews for a property."""
+        from reviews.models import Review
         from reviews.serializers import ReviewListSerializer
         property_obj = self.get_object()
-        reviews = property_obj.reviews.filter(is_visible=True)
+        # Not the related manager: it would read each row's deferred
+        # property_id to attach property_obj
+        reviews = ReviewListSerializer.setup_queryset(
+            Review.objects.filter(property=property_obj, is_visible=True)
+        )
         serializer = ReviewListSerializer(reviews, many=True)
         return Response(serializer.data)
     
@@ -90,14 +106,18 @@ class PropertyViewSet(viewsets.ModelViewSet):
         property_obj = self.get_object()
         amenities = request.data.get('amenities', [])
         
-        created = []
-        for amenity_code in amenities:
-            amenity, is_created = PropertyAmenity.objects.get_or_create(
-                property=property_obj,
-                amenity=amenity_code
-            )
-            if is_created:
-                created.append(amenity_code)
+        # One SELECT for the existing codes and one INSERT for the rest
+        existing = set(PropertyAmenity.objects.filter(
+            property=property_obj, amenity__in=amenities
+        ).values_list('amenity', flat=True))
+        created = [
+            amenity_code for amenity_code in dict.fromkeys(amenities)
+            if amenity_code not in existing
+        ]
+        PropertyAmenity.objects.bulk_create([
+            PropertyAmenity(property=property_obj, amenity=amenity_code)
+            for amenity_code in created
+        ], ignore_conflicts=True)
         
         return Response({
             'message': f'Added {len(created)} amenities',
@@ -136,8 +156,8 @@ class RentalUnitViewSet(viewsets.ModelViewSet):
     
     def get_permissions(self):
         if self.action in ['list', 'retrieve']:
-            return [IsAuthenticated()]
-        return [IsPropertyOwner()]
+            return IS_AUTHENTICATED
+        return IS_PROPERTY_OWNER
     
     @action(detail=False, methods=['get'])
     def available(self, request):
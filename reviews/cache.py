@@ -0,0 +1,29 @@
+import hashlib
+
+from django.db.models import Count, Max
+
+from accounts.cache import bump_versions, get_version
+
+
+# ==================== Review List Validators ====================
+
+REVIEWS_VERSION_KEY = 'reviews:list:v'
+
+
+def get_list_etag(queryset, request):
+    """Return a weak ETag for a filtered review list response."""
+    stats = queryset.aggregate(
+        count=Count('pk'), latest=Max('review_date'), responded=Max('response_date')
+    )
+    # The version covers edits that move neither the count nor the dates
+    raw = ':'.join(str(part) for part in (
+        get_version(REVIEWS_VERSION_KEY), stats['count'], stats['latest'],
+        stats['responded'], request.accepted_renderer.format,
+        request.get_full_path()
+    ))
+    return f'W/"{hashlib.md5(raw.encode()).hexdigest()}"'
+
+
+def invalidate_review_lists():
+    """Change the ETag of every review list."""
+    bump_versions([REVIEWS_VERSION_KEY])
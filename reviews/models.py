@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 from django.core.validators import MinValueValidator, MaxValueValidator
 from accounts.models import User, Tenant
 from properties.models import Property
@@ -40,6 +41,22 @@ class Review(models.Model):
     
     class Meta:
         ordering = ['-review_date']
+        indexes = [
+            # ReviewViewSet only lists visible reviews, newest first, optionally
+            # narrowed to one property or tenant
+            models.Index(
+                fields=['-review_date'], name='review_visible_date_idx',
+                condition=Q(is_visible=True)
+            ),
+            models.Index(
+                fields=['property', '-review_date'], name='review_visible_prop_idx',
+                condition=Q(is_visible=True)
+            ),
+            models.Index(
+                fields=['tenant', '-review_date'], name='review_visible_tenant_idx',
+                condition=Q(is_visible=True)
+            ),
+        ]
     
     def __str__(self):
         return f"Review by {self.reviewer.get_full_name()} - {self.rating} stars"
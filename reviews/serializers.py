@@ -1,22 +1,41 @@
+from django.db.models import Value
+from django.db.models.functions import Concat, Trim
 from rest_framework import serializers
 from .models import Review
-from accounts.serializers import UserListSerializer
+from accounts.serializers import UserListSerializer, CachedFieldsMixin, FastListSerializer
 from leases.models import LeaseAgreement
 
 
 # ==================== Review Serializers ====================
 
-class ReviewListSerializer(serializers.ModelSerializer):
-    """Minimal review data."""
-    reviewer_name = serializers.SerializerMethodField()
+class ReviewListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Minimal review data.
+    
+    Querysets passed to this serializer must go through setup_queryset(),
+    which annotates the reviewer's name.
+    """
+    reviewer_name = serializers.CharField(
+        source='reviewer_full_name', read_only=True
+    )
     
     class Meta:
         model = Review
         fields = ['id', 'review_type', 'reviewer_name', 'rating', 
                   'comment', 'review_date', 'response', 'response_date']
+        read_only_fields = fields
+        list_serializer_class = FastListSerializer
     
-    def get_reviewer_name(self, obj):
-        return obj.reviewer.get_full_name()
+    @staticmethod
+    def setup_queryset(queryset):
+        """Load only the columns this serializer reads."""
+        # Same result as User.get_full_name(), built by the database
+        return queryset.only(
+            'id', 'review_type', 'rating', 'comment', 'review_date',
+            'response', 'response_date'
+        ).annotate(reviewer_full_name=Trim(Concat(
+            'reviewer__first_name', Value(' '), 'reviewer__last_name'
+        )))
 
 
 class ReviewSerializer(serializers.ModelSerializer):
@@ -24,7 +43,9 @@ class ReviewSerializer(serializers.ModelSerializer):
     reviewer = UserListSerializer(read_only=True)
     property_info = serializers.SerializerMethodField()
     tenant_info = serializers.SerializerMethodField()
-    response_by_name = serializers.SerializerMethodField()
+    response_by_name = serializers.CharField(
+        source='response_by.get_full_name', read_only=True, allow_null=True
+    )
     
     class Meta:
         model = Review
@@ -34,6 +55,13 @@ class ReviewSerializer(serializers.ModelSerializer):
                   'response_by', 'response_by_name', 'is_visible']
         read_only_fields = ['id', 'review_date', 'response_date', 'response_by']
     
+    @staticmethod
+    def setup_queryset(queryset):
+        """Join the users, tenant and property this serializer renders."""
+        return queryset.select_related(
+            'reviewer', 'tenant__user', 'property', 'response_by'
+        )
+    
     def get_property_info(self, obj):
         if obj.property:
             return {'id': obj.property.id, 'title': obj.property.title}
@@ -43,11 +71,6 @@ class ReviewSerializer(serializers.ModelSerializer):
         if obj.tenant:
             return {'id': obj.tenant.id, 'name': obj.tenant.user.get_full_name()}
         return None
-    
-    def get_response_by_name(self, obj):
-        if obj.response_by:
-            return obj.response_by.get_full_name()
-        return None
 
 
 class ReviewCreateSerializer(serializers.ModelSerializer):
@@ -98,5 +121,8 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
 
 
 class ReviewResponseSerializer(serializers.Serializer):
-    """Serializer for responding to reviews."""
+    """Serializer for responding to reviews; renders only the response fields."""
+    id = serializers.IntegerField(read_only=True)
     response = serializers.CharField()
+    response_date = serializers.DateTimeField(read_only=True)
+    response_by = serializers.PrimaryKeyRelatedField(read_only=True)
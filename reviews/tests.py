@@ -1,3 +1,71 @@
+from datetime import timedelta
+from decimal import Decimal
+
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from leases.models import LeaseAgreement
+from localities.models import LocalityLevel, Locality
+from properties.models import Property, RentalUnit
+from .models import Review
+
+
+# ==================== Review List Pages ====================
+
+class ReviewPaginationTests(TestCase):
+    """The review list comes in keyset pages of 25."""
+
+    def setUp(self):
+        owner_user = User.objects.create_user(
+            username='owner', password='pass12345!', user_type='owner',
+            phone_number='+255700000002'
+        )
+        tenant_user = User.objects.create_user(
+            username='tenant', password='pass12345!', user_type='tenant',
+            phone_number='+255700000001'
+        )
+        level = LocalityLevel.objects.create(name='Ward', slug='ward')
+        property_obj = Property.objects.create(
+            owner=owner_user.owner_profile, property_type='house', title='House',
+            description='A house', monthly_rent=Decimal('100'),
+            locality=Locality.objects.create(name='Ward 1', level=level)
+        )
+        unit = RentalUnit.objects.create(
+            property=property_obj, unit_type='single_room',
+            unit_number='1', unit_rent=Decimal('50')
+        )
+        today = timezone.now().date()
+        lease = LeaseAgreement.objects.create(
+            tenant=tenant_user.tenant_profile, unit=unit, start_date=today,
+            end_date=today + timedelta(days=30),
+            monthly_rent=Decimal('50'), security_deposit=Decimal('10')
+        )
+        Review.objects.bulk_create([
+            Review(
+                review_type='tenant_to_property', reviewer=tenant_user,
+                property=property_obj, lease=lease, rating=i % 5 + 1, comment='Good'
+            )
+            for i in range(30)
+        ])
+        self.client = APIClient()
+        self.client.force_authenticate(tenant_user)
+
+    def test_pages_of_25(self):
+        first = self.client.get('/api/reviews/reviews/').data
+        self.assertEqual(len(first['results']), 25)
+
+        second = self.client.get(first['next']).data
+        self.assertEqual(len(second['results']), 5)
+        self.assertIsNone(second['next'])
+
+        ids = [row['id'] for row in first['results'] + second['results']]
+        self.assertEqual(ids, list(
+            Review.objects.order_by('-review_date', '-id').values_list('pk', flat=True)
+        ))
 
-# Create your tests here.
+    def test_rating_ordering_is_ignored(self):
+        ordered = self.client.get('/api/reviews/reviews/?ordering=rating').data
+        default = self.client.get('/api/reviews/reviews/').data
+        self.assertEqual(ordered['results'], default['results'])
@@ -1,24 +1,35 @@
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
 
+from .cache import get_list_etag
 from .models import Review
 from .serializers import (
     ReviewSerializer, ReviewListSerializer, ReviewCreateSerializer,
     ReviewResponseSerializer
 )
+from accounts.pagination import KeysetPagination
+from accounts.permissions import IS_AUTHENTICATED
 from notifications.services import NotificationService
 
 
+class ReviewPagination(KeysetPagination):
+    """Keyset pages of 25 reviews."""
+    page_size = 25
+
+
 class ReviewViewSet(viewsets.ModelViewSet):
     """ViewSet for managing reviews."""
     
     queryset = Review.objects.all()
     filter_backends = [filters.OrderingFilter]
-    ordering_fields = ['rating', 'review_date']
-    ordering = ['-review_date']
+    # rating has five values, so keyset pages on it would mostly be offset
+    # scans through ties; only offer the (nearly unique) review date
+    ordering_fields = ['review_date']
+    ordering = ['-review_date', '-id']
+    pagination_class = ReviewPagination
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -28,23 +39,41 @@ class ReviewViewSet(viewsets.ModelViewSet):
         return ReviewSerializer
     
     def get_permissions(self):
-        return [IsAuthenticated()]
+        return IS_AUTHENTICATED
+    
+    # Actions rendering ReviewListSerializer get its narrowed queryset
+    list_actions = ('list',)
     
     def get_queryset(self):
         queryset = Review.objects.filter(is_visible=True)
+        if self.action in self.list_actions:
+            queryset = ReviewListSerializer.setup_queryset(queryset)
+        else:
+            queryset = ReviewSerializer.setup_queryset(queryset)
         
-        # Filter by property if specified
-        property_id = self.request.query_params.get('property')
-        if property_id:
-            queryset = queryset.filter(property_id=property_id)
-        
-        # Filter by tenant if specified
-        tenant_id = self.request.query_params.get('tenant')
-        if tenant_id:
-            queryset = queryset.filter(tenant_id=tenant_id)
+        # Filter by property and/or tenant if specified; an id that is not
+        # a number cannot match any review
+        for param in ('property', 'tenant'):
+            value = self.request.query_params.get(param)
+            if not value:
+                continue
+            try:
+                queryset = queryset.filter(**{f'{param}_id': int(value)})
+            except ValueError:
+                return queryset.none()
         
         return queryset
     
+    def list(self, request, *args, **kwargs):
+        # Answer a matching If-None-Match before any rows are serialized
+        etag = get_list_etag(self.filter_queryset(self.get_queryset()), request)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+        response = super().list(request, *args, **kwargs)
+        response['ETag'] = etag
+        return response
+    
     @action(detail=True, methods=['post'])
     def respond(self, request, pk=None):
         """Add a response to a review."""
@@ -56,13 +85,17 @@ class ReviewViewSet(viewsets.ModelViewSet):
         user = request.user
         can_respond = False
         
+        # Compare ids so the joined property/tenant rows are enough and the
+        # property's owner is never loaded
         if review.review_type == 'tenant_to_property':
             # Owner can respond
-            if hasattr(user, 'owner_profile') and review.property.owner == user.owner_profile:
+            owner = getattr(user, 'owner_profile', None)
+            if owner is not None and review.property.owner_id == owner.pk:
                 can_respond = True
         elif review.review_type == 'owner_to_tenant':
             # Tenant can respond
-            if hasattr(user, 'tenant_profile') and review.tenant == user.tenant_profile:
+            tenant = getattr(user, 'tenant_profile', None)
+            if tenant is not None and review.tenant_id == tenant.pk:
                 can_respond = True
         
         if not can_respond:
@@ -74,9 +107,16 @@ class ReviewViewSet(viewsets.ModelViewSet):
         review.response = serializer.validated_data['response']
         review.response_date = timezone.now()
         review.response_by = user
-        review.save()
+        # A response leaves the rating untouched, so write the columns
+        # directly and skip the listing-cache signals a save() would send
+        Review.objects.filter(pk=review.pk).update(
+            response=review.response,
+            response_date=review.response_date,
+            response_by=user
+        )
         
         # Send notification
-        NotificationService.send_review_response(review)
+        NotificationService.send_on_commit('review_response', review)
         
-        return Response(ReviewSerializer(review).data)
+        # The client already has the review; send back what changed
+        return Response(ReviewResponseSerializer(review).data)